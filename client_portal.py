@@ -1,54 +1,292 @@
 import os
+import copy
+import gzip
 import json
+import hashlib
 import logging
-import pandas as pd
+import atexit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify, redirect, url_for, session, flash
+from functools import lru_cache
+from markupsafe import Markup
+from operator import itemgetter
+from flask import Flask, render_template, render_template_string, request, jsonify, redirect, url_for, session, flash, Response
+try:
+    from flask import stream_template
+except ImportError:  # stream_template arrived in Flask 2.2
+    stream_template = None
 from flask_bootstrap import Bootstrap
-import plotly.express as px
-import plotly.graph_objects as go
-import plotly.utils
-from threading import Thread
+from flask_compress import Compress
+from jinja2 import FileSystemBytecodeCache
+from threading import Thread, Event, Lock, RLock
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import SimpleQueue, Queue, Empty
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 import time
 from simple_account_storage import load_account_details, save_account_details, update_account_with_orders, load_orders_from_csv
 
-# Import our modules
-from ibkr_client import IBKRApp
-from portfolio_manager import PortfolioManager
-from investment_manager import InvestmentManager
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("client_portal.log"),
-        logging.StreamHandler()
-    ]
-)
+# pandas, plotly and the IBKR/manager modules are imported lazily inside the
+# functions that need them — they dominate startup time and routes like '/'
+# never touch them
+
+# Set up logging. Request threads only enqueue records; a background
+# QueueListener owns the file/console handlers so log writes never block
+# the request path.
+_log_queue = SimpleQueue()
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_file_handler = RotatingFileHandler("client_portal.log",
+                                    maxBytes=10_000_000, backupCount=3)
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler,
+                              respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
 # Initialize Flask app
 app = Flask(__name__)
 app.secret_key = 'arki_portfolio_management_secret_key'  # For session management
 Bootstrap(app)
+# Compress HTML/JSON/CSS/JS responses; the inline Plotly chart JSON is highly
+# redundant (repeated keys, float digits) and shrinks 5-10x. Prefer brotli
+# when the client accepts it, with gzip as the fallback.
+app.config['COMPRESS_MIMETYPES'] = ['text/html', 'application/json',
+                                    'text/css', 'application/javascript']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_BR_LEVEL'] = 4  # sweet spot for dynamic responses
+Compress(app)
 
-# Application state
-app_state = {
-    'ibkr_app': None,
-    'portfolio_manager': None,
-    'investment_manager': None,
-    'connected': False,
-    'config_path': 'config',
-    'static_account_data': None  # For storing the loaded account data
-}
+# Route jsonify through orjson so the remaining jsonify responses (connect,
+# deposit, transfer, errors) use the Rust encoder too. The provider API
+# arrived in Flask 2.2, so fall back silently on older versions.
+if orjson is not None:
+    try:
+        from flask.json.provider import DefaultJSONProvider
+    except ImportError:
+        DefaultJSONProvider = None
+    if DefaultJSONProvider is not None:
+        class OrjsonProvider(DefaultJSONProvider):
+            """JSON provider backed by orjson"""
+
+            def dumps(self, obj, **kwargs):
+                return orjson.dumps(obj).decode()
+
+            def loads(self, s, **kwargs):
+                return orjson.loads(s)
+
+        app.json = OrjsonProvider(app)
+
+# Templates never change while the app is running, so compile each one once
+# and keep it cached for the lifetime of the process instead of re-statting
+# and potentially recompiling on every render.
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+app.jinja_env.auto_reload = False
+app.jinja_env.cache_size = -1
+
+# Persist compiled template bytecode across restarts so a fresh process
+# unpickles it instead of re-running the Jinja parser
+_jinja_cache_dir = os.path.join('config', '.jinja_cache')
+os.makedirs(_jinja_cache_dir, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(
+    directory=_jinja_cache_dir, pattern='__jinja2_%s.cache')
+
+# Static filenames carry a content hash (style.<hash>.css), so clients can
+# cache them for a year -- a changed file gets a new URL. Behind a front
+# server that understands X-Sendfile, hand the transfer off to it entirely.
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE') == '1'
+
+@app.context_processor
+def inject_static_names():
+    """Expose the content-hashed static filenames to every template"""
+    return {'style_css': _STYLE_CSS_NAME}
+
+# Application state — slots make every access a C-level attribute lookup
+# instead of a dict hash, and typos fail loudly
+class AppState:
+    """Process-wide application state shared across routes"""
+
+    __slots__ = (
+        'ibkr_app', 'portfolio_manager', 'investment_manager', 'connected',
+        'config_path', 'static_account_data', 'config_cache',
+        'dashboard_cache', 'api_cache', 'refresher_started', 'last_refresh',
+        'last_refresh_iso', 'positions_cache', 'charts_cache',
+        'templates_dir', 'static_dir', 'portfolio_csv', 'initialized',
+        'connect_event', 'connect_future',
+        'cash_account_id', 'investment_account_id'
+    )
+
+    def __init__(self):
+        self.ibkr_app = None
+        self.portfolio_manager = None
+        self.investment_manager = None
+        self.connected = False
+        self.config_path = 'config'
+        # Paths used repeatedly at startup, built once instead of per call
+        self.templates_dir = Path('templates')
+        self.static_dir = Path('static')
+        self.portfolio_csv = Path(self.config_path) / 'portfolio_allocation.csv'
+        self.initialized = False  # Whether init_app() has completed
+        self.connect_event = Event()  # Set once the async connect finishes
+        self.connect_future = None  # In-flight connect job, shared across clicks
+        self.cash_account_id = None  # Account IDs cached at initialize time
+        self.investment_account_id = None
+        self.static_account_data = None  # For storing the loaded account data
+        self.config_cache = {'mtime': None, 'data': None}  # Parsed config keyed by file mtime
+        self.dashboard_cache = {'key': None, 'ts': 0.0, 'payload': None}  # TTL cache for dashboard bootstrap data
+        self.api_cache = {'ts': 0.0, 'body': None}  # TTL cache for the /api/account_data response body
+        self.refresher_started = False  # Whether the background account refresher is running
+        self.last_refresh = None  # time.time() of the last account snapshot refresh
+        self.last_refresh_iso = None  # Pre-formatted ISO timestamp of the last refresh
+        self.positions_cache = {'source': None, 'df': None}  # Shared investment positions DataFrame
+        self.charts_cache = {'ts': 0.0, 'body': None}  # TTL cache for the /api/charts response body
+
+app_state = AppState()
+
+# Serializes access to the thread-unsafe IBKR/manager operations now that
+# requests are handled concurrently
+ibkr_lock = RLock()
+
+def invalidate_dashboard_cache():
+    """Drop the cached dashboard payload after account data changes"""
+    app_state.dashboard_cache['payload'] = None
+    app_state.positions_cache['df'] = None
+    app_state.charts_cache['body'] = None
+    app_state.api_cache['body'] = None
+
+def mark_snapshot_refreshed():
+    """Record when the account snapshot was refreshed, with a pre-formatted timestamp"""
+    app_state.last_refresh = time.time()
+    app_state.last_refresh_iso = datetime.now().isoformat()
+
+def money(value):
+    """Format a number as a 2-dp money string with thousands separators"""
+    try:
+        return f"{float(value):,.2f}"
+    except (TypeError, ValueError):
+        return "0.00"
+
+def get_recent_transactions(cash_account, limit=10):
+    """Most recent transactions, sorted and sliced in Python instead of Jinja"""
+    transactions = (cash_account or {}).get('transactions') or []
+    recent = sorted(transactions, key=itemgetter('timestamp'), reverse=True)[:limit]
+    # Pre-format the money cells here, once per refresh, instead of running
+    # the "%.2f"|format filter per cell per render
+    return [dict(tx, amount_str=money(tx.get('amount')),
+                 balance_after_str=money(tx.get('balance_after')))
+            for tx in recent]
+
+POSITION_COLUMNS = ('key', 'symbol', 'secType', 'position', 'marketPrice', 'marketValue')
+
+def build_positions_df(positions):
+    """Build the canonical positions DataFrame from a raw positions dict"""
+
+    import pandas as pd
+
+    records = []
+    for key, pos in positions.items():
+        # Only include actual position objects
+        if isinstance(pos, dict) and ('symbol' in pos or 'position' in pos):
+            records.append({
+                'key': key,
+                'symbol': pos.get('symbol') or key.partition('_')[0],
+                'secType': pos.get('secType', ''),
+                'position': pos.get('position', 0),
+                'marketPrice': pos.get('marketPrice', 0),
+                'marketValue': pos.get('marketValue', 0)
+            })
+
+    return pd.DataFrame.from_records(records, columns=POSITION_COLUMNS)
+
+def get_investment_positions_df():
+    """Get the shared investment positions DataFrame, rebuilt on data change"""
+
+    raw = app_state.static_account_data
+    positions = raw.get('positions', {}) if raw else {}
+
+    cache = app_state.positions_cache
+    if cache['df'] is not None and cache['source'] is positions:
+        return cache['df']
+
+    df = build_positions_df(positions)
+    cache['source'] = positions
+    cache['df'] = df
+    return df
+
+# JSON file helpers (orjson is C-accelerated; stdlib json is the fallback)
+def read_json_file(path):
+    """Read and parse a JSON file"""
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps_bytes(data):
+    """Serialize data to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+def markup_json(payload):
+    """Mark pre-encoded JSON safe for an inline <script> block.
+
+    Escapes '<' the way Jinja's |tojson does, so a value containing
+    '</script>' cannot break out of the script context.
+    """
+    if isinstance(payload, bytes):
+        payload = payload.decode()
+    return Markup(payload.replace('<', '\\u003c'))
+
+def plotly_figure_json(fig):
+    """Encode a plotly figure to JSON, preferring orjson over plotly's encoder"""
+    if orjson is not None:
+        # to_plotly_json() yields the raw data/layout dict; orjson serializes
+        # the numeric numpy arrays px leaves in it without a Python-level
+        # walk. OPT_SERIALIZE_NUMPY rejects object-dtype arrays (px.pie
+        # stores its labels that way), so hand those to tolist() via default.
+        return orjson.dumps(fig.to_plotly_json(),
+                            option=orjson.OPT_SERIALIZE_NUMPY,
+                            default=lambda o: o.tolist()).decode()
+    import plotly.io
+    # Skip schema validation -- figures are built server-side from trusted data
+    return plotly.io.to_json(fig, validate=False)
+
+def write_json_file(path, data):
+    """Serialize data to an indented JSON file (atomic, skips no-op writes)"""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+
+    # Skip the write entirely when the content is unchanged (cheap memcmp)
+    try:
+        if Path(path).read_bytes() == payload:
+            return
+    except FileNotFoundError:
+        pass
+
+    # Write to a temp file then rename so readers never see a torn write
+    tmp_path = f"{path}.tmp"
+    Path(tmp_path).write_bytes(payload)
+    os.replace(tmp_path, path)
 
 # Configuration
 def load_config():
     """Load application configuration"""
     
-    config_file = os.path.join(app_state['config_path'], 'email')
+    config_file = os.path.join(app_state.config_path, 'email')
     default_config = {
         'ibkr': {
             'host': '127.0.0.1',
@@ -80,25 +318,36 @@ def load_config():
         }
     }
     
+    cache = app_state.config_cache
+
+    # Stat the file once; a missing file raises instead of costing a second syscall
+    try:
+        mtime = os.stat(config_file).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+
+    # Serve the cached config while the file on disk is unchanged
+    if mtime is not None and cache['mtime'] == mtime and cache['data'] is not None:
+        return cache['data']
+
     # Create default config if it doesn't exist
-    if not os.path.exists(config_file):
+    if mtime is None:
         os.makedirs(os.path.dirname(config_file), exist_ok=True)
-        with open(config_file, 'w') as f:
-            json.dump(default_config, f, indent=4)
+        write_json_file(config_file, default_config)
         logger.info(f"Created default client portal configuration at {config_file}")
+        cache['mtime'] = os.stat(config_file).st_mtime_ns
+        cache['data'] = default_config
         return default_config
-    
+
     # Load existing config
     try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-            
+        config = read_json_file(config_file)
+
         # Add email configuration if it doesn't exist
         if 'email' not in config:
             config['email'] = default_config['email']
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=4)
-                
+            write_json_file(config_file, config)
+
         # Make sure all required email parameters exist
         elif 'email' in config:
             email_updated = False
@@ -114,10 +363,12 @@ def load_config():
                 
             # Save updated config if needed
             if email_updated:
-                with open(config_file, 'w') as f:
-                    json.dump(config, f, indent=4)
-                    
+                write_json_file(config_file, config)
+
         logger.info(f"Loaded client portal configuration from {config_file}")
+        # Re-stat in case the email defaults were written back above
+        cache['mtime'] = os.stat(config_file).st_mtime_ns
+        cache['data'] = config
         return config
     except Exception as e:
         logger.error(f"Error loading client portal configuration: {e}", exc_info=True)
@@ -126,7 +377,11 @@ def load_config():
 # Initialize components
 def initialize_components():
     """Initialize IBKR client and managers"""
-    
+
+    from ibkr_client import IBKRApp
+    from portfolio_manager import PortfolioManager
+    from investment_manager import InvestmentManager
+
     config = load_config()
     # Debug logging for email config
     if 'email' in config and 'resend_api_key' in config['email']:
@@ -140,81 +395,185 @@ def initialize_components():
         logger.info(f"Email service configured: {config['email'].get('email_service', 'not specified')}")
     
     # Create IBKR client if it doesn't exist
-    if app_state['ibkr_app'] is None:
+    if app_state.ibkr_app is None:
         ibkr_config = config['ibkr']
-        app_state['ibkr_app'] = IBKRApp()
+        app_state.ibkr_app = IBKRApp()
     
     # Create portfolio manager (simulated cash account only) if it doesn't exist
-    if app_state['portfolio_manager'] is None:
-        app_state['portfolio_manager'] = PortfolioManager(config_path=app_state['config_path'])
+    if app_state.portfolio_manager is None:
+        app_state.portfolio_manager = PortfolioManager(config_path=app_state.config_path)
         # Add cash management settings from config
         if 'cash_management' in config:
-            app_state['portfolio_manager'].config.update(config['cash_management'])
+            app_state.portfolio_manager.config.update(config['cash_management'])
     
+    # Cache the account IDs so request handlers don't re-read the config
+    # just to fetch two strings
+    app_state.cash_account_id = config['accounts']['cash_account_id']
+    app_state.investment_account_id = config['accounts']['investment_account_id']
+
     # Create investment manager (real IBKR account) if it doesn't exist
-    if app_state['investment_manager'] is None:
+    if app_state.investment_manager is None:
         # Pass IBKR client directly to investment manager
-        app_state['investment_manager'] = InvestmentManager(app_state['ibkr_app'])
+        app_state.investment_manager = InvestmentManager(app_state.ibkr_app)
         # Set the investment account ID from config
-        app_state['investment_manager'].investment_account_id = config['accounts']['investment_account_id']
+        app_state.investment_manager.investment_account_id = config['accounts']['investment_account_id']
     
     # Load static account data from file
-    if app_state['static_account_data'] is None:
+    if app_state.static_account_data is None:
         account_id = config['accounts']['investment_account_id']
-        app_state['static_account_data'] = load_account_details(account_id)
+        app_state.static_account_data = load_account_details(account_id)
         
-        # Apply orders from CSV if account data was loaded
-        if app_state['static_account_data']:
-            orders = load_orders_from_csv()
-            if orders:
-                app_state['static_account_data'] = update_account_with_orders(app_state['static_account_data'], orders)
-                # Save updated account data
-                save_account_details(app_state['static_account_data'], account_id)
-                logger.info(f"Applied {len(orders)} orders to account {account_id}")
+        # Apply orders from CSV if account data was loaded. A content-hash
+        # sentinel records which CSV was last folded into the saved snapshot,
+        # so an unchanged file skips the whole parse/apply/rewrite on boot.
+        if app_state.static_account_data:
+            orders_csv = Path('logs') / 'orders.csv'
+            sentinel = Path('logs') / 'orders.lastapplied'
+            try:
+                csv_hash = hashlib.sha256(orders_csv.read_bytes()).hexdigest()
+            except FileNotFoundError:
+                csv_hash = None
+            applied_hash = sentinel.read_text() if sentinel.exists() else None
+            if csv_hash is not None and csv_hash != applied_hash:
+                orders = load_orders_from_csv()
+                snapshot_saved = True
+                if orders:
+                    app_state.static_account_data = update_account_with_orders(app_state.static_account_data, orders)
+                    # Save updated account data
+                    snapshot_saved = save_account_details(app_state.static_account_data, account_id)
+                    if snapshot_saved:
+                        logger.info(f"Applied {len(orders)} orders to account {account_id}")
+                    else:
+                        logger.warning(f"Applied {len(orders)} orders in memory but the snapshot save failed; will retry next boot")
+                # Only record the orders as folded in once the snapshot that
+                # contains them is actually on disk
+                if snapshot_saved:
+                    sentinel.write_text(csv_hash)
             
             # Set account data in investment manager
-            if app_state['investment_manager']:
-                app_state['investment_manager'].investment_account = app_state['static_account_data']
+            if app_state.investment_manager:
+                app_state.investment_manager.investment_account = app_state.static_account_data
+
+    # Keep the account snapshot fresh without per-request IBKR round-trips
+    start_account_refresher()
+
+def _account_refresh_loop():
+    """Background task that refreshes the account snapshot periodically"""
+
+    while True:
+        interval = load_config().get('dashboard', {}).get('refresh_interval', 60)
+        time.sleep(interval)
+        try:
+            portfolio_manager = app_state.portfolio_manager
+            if portfolio_manager:
+                with ibkr_lock:
+                    portfolio_manager.load_account_info()
+                mark_snapshot_refreshed()
+                invalidate_dashboard_cache()
+        except Exception as e:
+            logger.error(f"Error refreshing account data in background: {e}", exc_info=True)
+
+def start_account_refresher():
+    """Start the background account refresher thread (once)"""
+
+    if not app_state.refresher_started:
+        app_state.refresher_started = True
+        refresher = Thread(target=_account_refresh_loop)
+        refresher.daemon = True
+        refresher.start()
+        logger.info("Started background account refresher thread")
 
 # Connect to IBKR in a separate thread
+# Single worker: repeated /connect clicks share one in-flight job instead of
+# spawning a fresh thread per click
+# Account snapshot saves happen off the request thread. A single daemon
+# consumer drains the queue, and a burst of mutations inside the debounce
+# window coalesces into one disk write of the newest snapshot.
+_save_queue = Queue()
+
+def _account_save_worker():
+    while True:
+        item = _save_queue.get()
+        time.sleep(0.2)  # Debounce: let a burst of mutations settle
+        while True:
+            try:
+                item = _save_queue.get_nowait()
+            except Empty:
+                break
+        for attempt in range(3):
+            try:
+                if save_account_details(*item):
+                    break
+            except Exception as e:
+                logger.error(f"Background account save failed: {e}", exc_info=True)
+            time.sleep(1.0)
+        else:
+            logger.error("Giving up on background account save after 3 attempts")
+
+Thread(target=_account_save_worker, name='account-save', daemon=True).start()
+
+def save_account_details_async(account_data, account_id):
+    """Queue an account save so the POST path never blocks on disk.
+
+    The snapshot is deep-copied at enqueue time so the worker persists the
+    state as it was when the mutation finished, not whatever later request
+    handlers have half-applied by the time the debounce window closes.
+    """
+    _save_queue.put((copy.deepcopy(account_data), account_id))
+
+_connect_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ibkr-connect')
+_connect_lock = Lock()
+
 def connect_ibkr_async():
-    """Connect to IBKR in a separate thread (simulated for demo)"""
-    
+    """Connect to IBKR on the shared executor (simulated for demo)"""
+
     def connect_job():
         try:
             initialize_components()
             
             # For the demo, set connected to true without actually connecting
-            app_state['connected'] = True
+            app_state.connected = True
             logger.info("Demo mode active - using static account data instead of IBKR connection")
             
-            # Always load portfolio manager data 
-            if app_state['portfolio_manager']:
-                app_state['portfolio_manager'].load_account_info()
-                app_state['portfolio_manager'].load_portfolio_allocations()
-            
+            # Always load portfolio manager data
+            if app_state.portfolio_manager:
+                with ibkr_lock:
+                    app_state.portfolio_manager.load_account_info()
+                    app_state.portfolio_manager.load_portfolio_allocations()
+                mark_snapshot_refreshed()
+                invalidate_dashboard_cache()
+
         except Exception as e:
             logger.error(f"Error in connection setup: {e}", exc_info=True)
-            app_state['connected'] = False
+            app_state.connected = False
             
             # Even if setup fails, still load simulated cash account
             try:
-                if app_state['portfolio_manager']:
-                    app_state['portfolio_manager'].load_account_info()
-                    app_state['portfolio_manager'].load_portfolio_allocations()
+                if app_state.portfolio_manager:
+                    with ibkr_lock:
+                        app_state.portfolio_manager.load_account_info()
+                        app_state.portfolio_manager.load_portfolio_allocations()
             except Exception as inner_e:
                 logger.error(f"Error loading account info: {inner_e}", exc_info=True)
-    
-    # Start connection in a separate thread
-    thread = Thread(target=connect_job)
-    thread.daemon = True
-    thread.start()
-    return thread
+        finally:
+            # Wake anything waiting on the connect, success or not
+            app_state.connect_event.set()
+
+    # Submit at most one connect job at a time; callers can wait on the
+    # returned Future (or on connect_event) for readiness
+    with _connect_lock:
+        future = app_state.connect_future
+        if future is not None and not future.done():
+            return future
+        app_state.connect_event.clear()
+        future = _connect_executor.submit(connect_job)
+        app_state.connect_future = future
+        return future
 
 # Disconnect from IBKR
 def disconnect_ibkr():
     """Disconnect from IBKR (simulated for demo)"""
-    app_state['connected'] = False
+    app_state.connected = False
     logger.info("Demo mode: Disconnected from simulated IBKR connection")
 
 # Add a function to simulate cash deposit
@@ -222,61 +581,68 @@ def disconnect_ibkr():
 def deposit():
     """Deposit cash to simulated cash account"""
     
-    # Initialize components if needed
-    if app_state['portfolio_manager'] is None:
-        initialize_components()
+    # Bind shared state to locals once per request
+    portfolio_manager = app_state.portfolio_manager
+    investment_manager = app_state.investment_manager
+    static_account_data = app_state.static_account_data
     
     if request.method == 'POST':
-        amount = request.form.get('amount')
-        
-        if amount and float(amount) > 0:
-            success = app_state['portfolio_manager'].simulate_cash_deposit(float(amount))
-            
+        # Parse the amount exactly once
+        try:
+            amount = float(request.form.get('amount'))
+        except (TypeError, ValueError):
+            amount = 0.0
+
+        if amount > 0:
+            with ibkr_lock:
+                success = portfolio_manager.simulate_cash_deposit(amount)
+
             if success:
-                flash(f'Successfully deposited ${amount} to cash account', 'success')
+                flash(f'Successfully deposited ${amount:.2f} to cash account', 'success')
                 # Reload account info
-                app_state['portfolio_manager'].load_account_info()
-                
+                with ibkr_lock:
+                    portfolio_manager.load_account_info()
+                invalidate_dashboard_cache()
+
                 # Check if we need to transfer excess cash
-                cash_info = app_state['portfolio_manager'].check_cash_level()
+                with ibkr_lock:
+                    cash_info = portfolio_manager.check_cash_level()
                 
                 if 'should_transfer' in cash_info and cash_info['should_transfer']:
-                    # Get account IDs
-                    config = load_config()
-                    cash_account_id = app_state['portfolio_manager'].cash_account['id']
-                    investment_account_id = config['accounts']['investment_account_id']
+                    # Account IDs are cached on app_state at initialize time
+                    cash_account_id = portfolio_manager.cash_account['id']
+                    investment_account_id = app_state.investment_account_id
                     
                     # Calculate amount to transfer (excess cash)
                     transfer_amount = cash_info['excess_cash']
                     
                     # Perform transfer from simulated cash account
-                    transfer_success = app_state['portfolio_manager'].transfer_cash(
-                        amount=transfer_amount,
-                        from_account=cash_account_id,
-                        to_account=investment_account_id
-                    )
+                    with ibkr_lock:
+                        transfer_success = portfolio_manager.transfer_cash(
+                            amount=transfer_amount,
+                            from_account=cash_account_id,
+                            to_account=investment_account_id
+                        )
                     
                     if transfer_success:
                         flash(f'Automatically transferred ${transfer_amount:.2f} to investment account', 'success')
                         # Update investment account (same code as in the transfer route)
-                        if app_state['static_account_data']:
+                        if static_account_data:
                             try:
-                                # Update cash balances in static account data
-                                if 'data' in app_state['static_account_data'] and 'account_info' in app_state['static_account_data']['data']:
-                                    for key in ['TotalCashValue_SGD', 'AvailableFunds_SGD', 'CashBalance_BASE']:
-                                        if key in app_state['static_account_data']['data']['account_info']:
-                                            current_cash = float(app_state['static_account_data']['data']['account_info'][key])
-                                            app_state['static_account_data']['data']['account_info'][key] = str(current_cash + transfer_amount)
-                                
-                                # More update code as in your transfer route...
+                                # Update cash balances across both layouts,
+                                # same as the manual transfer route
+                                add_to_account_fields(
+                                    static_account_data,
+                                    ('TotalCashValue_SGD', 'AvailableFunds_SGD', 'CashBalance_BASE'),
+                                    transfer_amount)
                                 
                                 # Save updated account data
-                                save_account_details(app_state['static_account_data'], investment_account_id)
+                                save_account_details_async(static_account_data, investment_account_id)
                                 
                                 # Update investment manager
-                                if app_state['investment_manager']:
-                                    app_state['investment_manager'].investment_account = app_state['static_account_data']
-                                    app_state['investment_manager'].receive_cash_transfer(transfer_amount)
+                                if investment_manager:
+                                    investment_manager.investment_account = static_account_data
+                                    investment_manager.receive_cash_transfer(transfer_amount)
                             except Exception as e:
                                 logger.error(f"Error updating investment account after automatic transfer: {e}")
                     else:
@@ -295,20 +661,24 @@ def deposit():
 def transfer():
     """Transfer cash from cash account to investment account"""
     
-    # Initialize components if needed
-    if app_state['portfolio_manager'] is None or app_state['investment_manager'] is None:
-        initialize_components()
+    # Bind shared state to locals once per request
+    portfolio_manager = app_state.portfolio_manager
+    investment_manager = app_state.investment_manager
+    static_account_data = app_state.static_account_data
     
-    amount = request.form.get('amount')
-    
-    if not amount or float(amount) <= 0:
+    # Parse the amount exactly once
+    try:
+        amount = float(request.form.get('amount'))
+    except (TypeError, ValueError):
+        amount = 0.0
+
+    if amount <= 0:
         flash('Invalid transfer amount', 'warning')
         return redirect(url_for('dashboard'))
-    
-    amount = float(amount)
-    
+
     # Check if we have enough excess cash
-    cash_info = app_state['portfolio_manager'].check_cash_level()
+    with ibkr_lock:
+        cash_info = portfolio_manager.check_cash_level()
     
     if 'error' in cash_info:
         flash(f'Error checking cash level: {cash_info["error"]}', 'danger')
@@ -318,54 +688,39 @@ def transfer():
         flash(f'Transfer amount exceeds excess cash. Maximum available: ${cash_info["excess_cash"]:.2f}', 'warning')
         return redirect(url_for('dashboard'))
     
-    # Get account IDs
-    config = load_config()
-    cash_account_id = config['accounts']['cash_account_id']
-    investment_account_id = config['accounts']['investment_account_id']
+    # Account IDs are cached on app_state at initialize time
+    cash_account_id = app_state.cash_account_id
+    investment_account_id = app_state.investment_account_id
     
     # Perform transfer from simulated cash account
-    success_cash = app_state['portfolio_manager'].transfer_cash(
-        amount=amount,
-        from_account=cash_account_id,
-        to_account=investment_account_id
-    )
+    with ibkr_lock:
+        success_cash = portfolio_manager.transfer_cash(
+            amount=amount,
+            from_account=cash_account_id,
+            to_account=investment_account_id
+        )
     
     # Update static account data
     investment_success = False
-    if app_state['static_account_data']:
+    if static_account_data:
         try:
-            # Update cash balances in static account data
-            if 'data' in app_state['static_account_data'] and 'account_info' in app_state['static_account_data']['data']:
-                for key in ['TotalCashValue_SGD', 'AvailableFunds_SGD', 'CashBalance_BASE']:
-                    if key in app_state['static_account_data']['data']['account_info']:
-                        current_cash = float(app_state['static_account_data']['data']['account_info'][key])
-                        app_state['static_account_data']['data']['account_info'][key] = str(current_cash + amount)
-            
-            if 'summary' in app_state['static_account_data']:
-                for key in ['TotalCashValue_SGD', 'AvailableFunds_SGD', 'CashBalance_BASE']:
-                    if key in app_state['static_account_data']['summary']:
-                        current_cash = float(app_state['static_account_data']['summary'][key])
-                        app_state['static_account_data']['summary'][key] = str(current_cash + amount)
-            
-            # Update portfolio values
-            for key in ['NetLiquidation_SGD', 'EquityWithLoanValue_SGD']:
-                if 'data' in app_state['static_account_data'] and 'account_info' in app_state['static_account_data']['data']:
-                    if key in app_state['static_account_data']['data']['account_info']:
-                        current_value = float(app_state['static_account_data']['data']['account_info'][key])
-                        app_state['static_account_data']['data']['account_info'][key] = str(current_value + amount)
-                
-                if 'summary' in app_state['static_account_data']:
-                    if key in app_state['static_account_data']['summary']:
-                        current_value = float(app_state['static_account_data']['summary'][key])
-                        app_state['static_account_data']['summary'][key] = str(current_value + amount)
+            # Update cash balances and portfolio values across both layouts
+            add_to_account_fields(
+                static_account_data,
+                ('TotalCashValue_SGD', 'AvailableFunds_SGD', 'CashBalance_BASE'),
+                amount)
+            add_to_account_fields(
+                static_account_data,
+                ('NetLiquidation_SGD', 'EquityWithLoanValue_SGD'),
+                amount)
             
             # Save updated account data
-            save_account_details(app_state['static_account_data'], investment_account_id)
+            save_account_details_async(static_account_data, investment_account_id)
             
             # Update investment manager
-            if app_state['investment_manager']:
-                app_state['investment_manager'].investment_account = app_state['static_account_data']
-                app_state['investment_manager'].receive_cash_transfer(amount)
+            if investment_manager:
+                investment_manager.investment_account = static_account_data
+                investment_manager.receive_cash_transfer(amount)
             
             investment_success = True
             
@@ -373,10 +728,16 @@ def transfer():
             logger.error(f"Error updating investment account after transfer: {e}")
             investment_success = False
     
+    if success_cash:
+        # The cash account was debited either way, so the cached dashboard
+        # and API payloads are stale regardless of the investment-side update
+        invalidate_dashboard_cache()
+
     if success_cash and investment_success:
         flash(f'Successfully transferred ${amount:.2f} to investment account', 'success')
         # Reload account info
-        app_state['portfolio_manager'].load_account_info()
+        with ibkr_lock:
+            portfolio_manager.load_account_info()
     elif success_cash:
         flash(f'Transfer completed, but there was an issue updating investment account', 'warning')
     else:
@@ -384,17 +745,39 @@ def transfer():
     
     return redirect(url_for('dashboard'))
 
+# One-shot component initialization before the first real request. The flag
+# read is all that remains on every request afterwards; the lock closes the
+# race where two concurrent first requests both built managers.
+_components_lock = Lock()
+_components_ready = False
+
+@app.before_request
+def ensure_components():
+    """Initialize the managers exactly once, before the first request"""
+    global _components_ready
+    if _components_ready:
+        return
+    with _components_lock:
+        if not _components_ready:
+            # WSGI servers import this module without running the __main__
+            # block, so make sure the filesystem setup (templates, hashed
+            # CSS) has happened before the first response links those
+            # assets. init_app() is idempotent and a no-op after __main__.
+            init_app()
+            initialize_components()
+            _components_ready = True
+
 # Flask routes
 @app.route('/')
 def index():
     """Home page"""
-    return render_template('index.html', connected=app_state['connected'])
+    return render_template('index.html', connected=app_state.connected)
 
 @app.route('/connect', methods=['POST'])
 def connect():
     """Connect to IBKR"""
     
-    if not app_state['connected']:
+    if not app_state.connected:
         connect_ibkr_async()
         flash('Connecting to IBKR...', 'info')
     else:
@@ -406,7 +789,7 @@ def connect():
 def disconnect():
     """Disconnect from IBKR"""
     
-    if app_state['connected']:
+    if app_state.connected:
         disconnect_ibkr()
         flash('Disconnected from IBKR', 'info')
     else:
@@ -414,85 +797,96 @@ def disconnect():
     
     return redirect(url_for('index'))
 
+def _render_dashboard(**context):
+    """Render dashboard.html, streaming chunks as Jinja emits them.
+
+    The browser starts parsing the head/nav/account cards while the server
+    is still serializing the inline chart JSON further down the page.
+    """
+    if stream_template is not None:
+        return stream_template('dashboard.html', **context)
+    return render_template('dashboard.html', **context)
+
 @app.route('/dashboard')
 def dashboard():
     """Dashboard page"""
     
-    # Initialize components if needed
-    if app_state['portfolio_manager'] is None or app_state['investment_manager'] is None:
-        initialize_components()
+    # Kick off the demo connect on the first dashboard visit
+    if app_state.connect_future is None and not app_state.connected:
         connect_ibkr_async()
-    
-    # Wait a moment for initialization
-    time.sleep(1)
+
+    # Wait for the async connect to signal instead of a fixed 1s sleep;
+    # warm connections skip the wait entirely
+    if not app_state.connected:
+        app_state.connect_event.wait(timeout=2.0)
+
+    # Bind shared state to locals once per request
+    portfolio_manager = app_state.portfolio_manager
+    static_account_data = app_state.static_account_data
     
     # Get cash account information (from portfolio manager)
     try:
-        if app_state['portfolio_manager'].cash_account is None:
-            app_state['portfolio_manager'].load_account_info()
+        if portfolio_manager.cash_account is None:
+            with ibkr_lock:
+                portfolio_manager.load_account_info()
     except Exception as e:
         logger.error(f"Error loading cash account info: {e}", exc_info=True)
         flash('Error loading cash account information', 'danger')
     
-    # Get investment account information from static data
-    investment_account_raw = app_state['static_account_data']
-    
+    # Serve the bootstrap payload (account snapshot + charts) from cache while fresh
+    config = load_config()
+    cache = app_state.dashboard_cache
+    cash_account = portfolio_manager.cash_account
+    investment_account_raw = static_account_data
+    cache_key = (
+        cash_account.get('id') if cash_account else None,
+        investment_account_raw.get('id') if investment_account_raw else None
+    )
+    cache_ttl = config.get('dashboard', {}).get('refresh_interval', 60)
+
+    if (cache['payload'] is not None and cache['key'] == cache_key
+            and time.time() - cache['ts'] < cache_ttl):
+        account_data, cash_info, allocation_chart, performance_chart, recent_transactions, fmt = cache['payload']
+        return _render_dashboard(
+            account_data=account_data,
+            cash_info=cash_info,
+            allocation_chart=allocation_chart,
+            performance_chart=performance_chart,
+            cash_account=cash_account,
+            recent_transactions=recent_transactions,
+            fmt=fmt,
+            connected=app_state.connected
+        )
+
     # Process investment account data for dashboard display
     processed_investment_account = {
         'id': 'N/A',
         'cash_balance': 0.0,
         'total_value': 0.0,
-        'positions': {}
+        'position_count': 0
     }
-    
+
     if investment_account_raw:
         # Basic account information
         processed_investment_account['id'] = investment_account_raw.get('id', 'N/A')
         
-        # Extract positions (filter out non-position entries)
-        positions = {}
-        if 'positions' in investment_account_raw:
-            for key, pos in investment_account_raw['positions'].items():
-                if isinstance(pos, dict) and 'symbol' in pos and 'marketValue' in pos:
-                    positions[key] = pos
-        
-        processed_investment_account['positions'] = positions
-        
-        # Calculate total position value
-        position_value = sum(float(pos.get('marketValue', 0)) for pos in positions.values())
+        # Positions come from the shared filtered DataFrame, which is cached
+        # and rebuilt only when the underlying snapshot changes
+        positions_df = get_investment_positions_df()
+        position_value = float(positions_df['marketValue'].sum()) if len(positions_df) else 0.0
         
-        # Get cash balance - try different paths
-        cash_balance = 0.0
-        
-        # Try data/account_info path first
-        if ('data' in investment_account_raw and 
-            'account_info' in investment_account_raw['data'] and 
-            'TotalCashValue_SGD' in investment_account_raw['data']['account_info']):
-            cash_balance = float(investment_account_raw['data']['account_info']['TotalCashValue_SGD'])
-        # Then try summary path
-        elif ('summary' in investment_account_raw and 
-              'TotalCashValue_SGD' in investment_account_raw['summary']):
-            cash_balance = float(investment_account_raw['summary']['TotalCashValue_SGD'])
-        # If both fail, check positions for cash value
-        elif 'CashBalance_BASE' in investment_account_raw.get('positions', {}):
-            cash_balance = float(investment_account_raw['positions']['CashBalance_BASE'])
+        # Get cash balance - probe the known layouts once
+        cash_balance = get_account_field(investment_account_raw, 'TotalCashValue_SGD')
+        if cash_balance is None:
+            # If both layouts fail, check positions for a cash entry
+            cash_entry = investment_account_raw.get('positions', {}).get('CashBalance_BASE')
+            cash_balance = float(cash_entry) if cash_entry is not None else 0.0
         
         processed_investment_account['cash_balance'] = cash_balance
         
-        # Get portfolio value - try different paths
-        portfolio_value = 0.0
-        
-        # Try data/account_info path first
-        if ('data' in investment_account_raw and 
-            'account_info' in investment_account_raw['data'] and 
-            'NetLiquidation_SGD' in investment_account_raw['data']['account_info']):
-            portfolio_value = float(investment_account_raw['data']['account_info']['NetLiquidation_SGD'])
-        # Then try summary path
-        elif ('summary' in investment_account_raw and 
-              'NetLiquidation_SGD' in investment_account_raw['summary']):
-            portfolio_value = float(investment_account_raw['summary']['NetLiquidation_SGD'])
-        # If both fail, calculate from positions and cash
-        else:
+        # Get portfolio value - probe the known layouts, else derive it
+        portfolio_value = get_account_field(investment_account_raw, 'NetLiquidation_SGD')
+        if portfolio_value is None:
             portfolio_value = position_value + cash_balance
         
         processed_investment_account['total_value'] = portfolio_value
@@ -500,97 +894,127 @@ def dashboard():
         # Add additional useful information
         
         # Available funds
-        if ('data' in investment_account_raw and 
-            'account_info' in investment_account_raw['data'] and 
-            'AvailableFunds_SGD' in investment_account_raw['data']['account_info']):
-            processed_investment_account['available_funds'] = float(investment_account_raw['data']['account_info']['AvailableFunds_SGD'])
-        elif ('summary' in investment_account_raw and 
-              'AvailableFunds_SGD' in investment_account_raw['summary']):
-            processed_investment_account['available_funds'] = float(investment_account_raw['summary']['AvailableFunds_SGD'])
-        else:
-            processed_investment_account['available_funds'] = cash_balance
+        available_funds = get_account_field(investment_account_raw, 'AvailableFunds_SGD')
+        processed_investment_account['available_funds'] = (
+            available_funds if available_funds is not None else cash_balance)
         
         # Position count
-        processed_investment_account['position_count'] = len(positions)
+        processed_investment_account['position_count'] = len(positions_df)
         
         # Position value
         processed_investment_account['position_value'] = position_value
     
     # Prepare account data for template
     account_data = {
-        'cash_account': app_state['portfolio_manager'].cash_account,
+        'cash_account': portfolio_manager.cash_account,
         'investment_account': processed_investment_account
     }
     
-    # Generate charts
+    # Generate charts. Pre-wrapping the JSON in Markup lets the template
+    # interpolate it directly without |safe filter dispatch per render.
     allocation_chart = generate_allocation_chart()
     performance_chart = generate_performance_chart()
+    allocation_chart = markup_json(allocation_chart) if allocation_chart else None
+    performance_chart = markup_json(performance_chart) if performance_chart else None
     
     # Format cash level data
-    cash_info = app_state['portfolio_manager'].check_cash_level()
-    
-    return render_template(
-        'dashboard.html',
+    with ibkr_lock:
+        cash_info = portfolio_manager.check_cash_level()
+
+    recent_transactions = get_recent_transactions(portfolio_manager.cash_account)
+
+    # Pre-format the headline money figures once; the template just emits
+    # plain strings instead of dispatching the format filter per field
+    cash_account_info = ((cash_account or {}).get('data') or {}).get('account_info') or {}
+    fmt = {
+        'cash_balance': money(cash_account_info.get('TotalCashValue_SGD', 0)),
+        'min_cash_level': money(cash_info.get('min_cash_level', 0)),
+        'excess_cash': money(cash_info.get('excess_cash', 0)),
+        'transfer_threshold': money(cash_info.get('transfer_threshold', 0)),
+        'investment_cash_balance': money(processed_investment_account.get('cash_balance', 0)),
+        'investment_total_value': money(processed_investment_account.get('total_value', 0))
+    }
+
+    # Cache the freshly built payload for subsequent loads
+    cache['key'] = cache_key
+    cache['ts'] = time.time()
+    cache['payload'] = (account_data, cash_info, allocation_chart,
+                        performance_chart, recent_transactions, fmt)
+
+    return _render_dashboard(
         account_data=account_data,
         cash_info=cash_info,
         allocation_chart=allocation_chart,
         performance_chart=performance_chart,
-        cash_account=app_state['portfolio_manager'].cash_account,
-        connected=app_state['connected']
+        cash_account=portfolio_manager.cash_account,
+        recent_transactions=recent_transactions,
+        fmt=fmt,
+        connected=app_state.connected
     )
 
 @app.route('/portfolio')
 def portfolio():
     """Portfolio details page"""
     
-    # Initialize components if needed
-    if app_state['portfolio_manager'] is None or app_state['investment_manager'] is None:
-        initialize_components()
+    # Bind shared state to locals once per request
+    portfolio_manager = app_state.portfolio_manager
+    investment_manager = app_state.investment_manager
     
     # Get cash portfolio data
     cash_portfolio = None
-    if app_state['portfolio_manager']:
-        cash_portfolio = app_state['portfolio_manager'].cash_portfolio
+    if portfolio_manager:
+        cash_portfolio = portfolio_manager.cash_portfolio
         if not cash_portfolio:
-            app_state['portfolio_manager'].load_portfolio_allocations()
-            cash_portfolio = app_state['portfolio_manager'].cash_portfolio
+            with ibkr_lock:
+                portfolio_manager.load_portfolio_allocations()
+            cash_portfolio = portfolio_manager.cash_portfolio
     
     # Get investment portfolio data from investment manager
     investment_portfolio = {}
-    if app_state['investment_manager'] and hasattr(app_state['investment_manager'], 'investment_portfolio'):
+    if investment_manager and hasattr(investment_manager, 'investment_portfolio'):
         if not investment_portfolio:
-            app_state['investment_manager'].load_portfolio_allocations()
-        investment_portfolio = app_state['investment_manager'].investment_portfolio
+            with ibkr_lock:
+                investment_manager.load_portfolio_allocations()
+        investment_portfolio = investment_manager.investment_portfolio
     
     # Get cash positions
     cash_positions = {}
-    if app_state['portfolio_manager'] and app_state['portfolio_manager'].cash_account:
-        cash_positions = app_state['portfolio_manager'].cash_account.get('positions', {})
-    
-    # Get investment positions from static data
-    investment_positions = {}
-    if app_state['static_account_data'] and 'positions' in app_state['static_account_data']:
-        positions = app_state['static_account_data']['positions']
-        for key, pos in positions.items():
-            # Only include actual position objects
-            if isinstance(pos, dict) and ('symbol' in pos or 'position' in pos):
-                investment_positions[key] = pos
-    
+    if portfolio_manager and portfolio_manager.cash_account:
+        cash_positions = portfolio_manager.cash_account.get('positions', {})
+    
+    # Ship the position rows as JSON and let DataTables render them on the
+    # client -- Jinja no longer loops over O(N) table cells per request
+    cash_rows = []
+    for position in cash_positions.values():
+        if not isinstance(position, dict):
+            continue
+        contract = position.get('contract') or {}
+        cash_rows.append({
+            'symbol': contract.get('symbol', ''),
+            'secType': contract.get('secType', ''),
+            'position': position.get('position', 0),
+            'marketPrice': position.get('marketPrice') or 0,
+            'marketValue': position.get('marketValue') or 0
+        })
+
+    # Get investment positions from the shared DataFrame
+    positions_df = get_investment_positions_df()
+    investment_rows = positions_df.drop(columns=['key']).to_dict('records')
+
     return render_template(
         'portfolio.html',
         cash_portfolio=cash_portfolio,
         investment_portfolio=investment_portfolio,
-        cash_positions=cash_positions,
-        investment_positions=investment_positions
+        cash_positions_json=markup_json(json_dumps_bytes(cash_rows)),
+        investment_positions_json=markup_json(json_dumps_bytes(investment_rows))
     )
 
 @app.route('/settings', methods=['GET', 'POST'])
 def settings():
     """Settings page"""
     
-    # Initialize components if needed
-    if app_state['portfolio_manager'] is None:
-        initialize_components()
+    # Bind shared state to locals once per request
+    portfolio_manager = app_state.portfolio_manager
     
     config = load_config()
     
@@ -609,18 +1033,17 @@ def settings():
             config['cash_management']['transfer_threshold'] = transfer_threshold
             
             # Save updated config
-            config_file = os.path.join(app_state['config_path'], 'client_portal_config.json')
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=4)
-            
+            config_file = os.path.join(app_state.config_path, 'client_portal_config.json')
+            write_json_file(config_file, config)
+
             # Update portfolio manager config
-            if app_state['portfolio_manager']:
-                app_state['portfolio_manager'].config['min_cash_level'] = min_cash_level
-                app_state['portfolio_manager'].config['transfer_threshold'] = transfer_threshold
+            if portfolio_manager:
+                portfolio_manager.config['min_cash_level'] = min_cash_level
+                portfolio_manager.config['transfer_threshold'] = transfer_threshold
                 
                 # Save simulated cash account if needed
-                if hasattr(app_state['portfolio_manager'], 'save_config'):
-                    app_state['portfolio_manager'].save_config()
+                if hasattr(portfolio_manager, 'save_config'):
+                    portfolio_manager.save_config()
             
             flash('Settings updated successfully', 'success')
         
@@ -636,20 +1059,48 @@ def settings():
         'ibkr_port': config['ibkr'].get('port', 7497)
     }
     
-    return render_template('settings.html', settings=settings_data)
+    connection_card = render_connection_card(app_state.config_cache['mtime'])
+    return render_template('settings.html', settings=settings_data,
+                           connection_card=connection_card)
+
+@app.route('/api/charts')
+def api_charts():
+    """API endpoint for dashboard chart JSON (consumed by Plotly.react)"""
+
+    # Serve the cached body while fresh
+    cache = app_state.charts_cache
+    cache_ttl = load_config().get('dashboard', {}).get('refresh_interval', 60)
+    if cache['body'] is not None and time.time() - cache['ts'] < cache_ttl:
+        return Response(cache['body'], mimetype='application/json')
+
+    allocation = generate_allocation_chart()
+    performance = generate_performance_chart()
+
+    # The chart helpers return pre-encoded JSON strings; splice them in
+    # directly instead of re-parsing and re-serializing them
+    body = (b'{"allocation":' + (allocation.encode() if allocation else b'null')
+            + b',"performance":' + (performance.encode() if performance else b'null') + b'}')
+
+    cache['ts'] = time.time()
+    cache['body'] = body
+
+    return Response(body, mimetype='application/json')
 
 @app.route('/api/account_data')
 def api_account_data():
     """API endpoint for account data"""
     
-    # Initialize components if needed
-    if app_state['portfolio_manager'] is None or app_state['investment_manager'] is None:
-        initialize_components()
-    
-    # Refresh account data
-    if app_state['portfolio_manager']:
-        app_state['portfolio_manager'].load_account_info()
-    
+    # Bind shared state to locals once per request
+    portfolio_manager = app_state.portfolio_manager
+    static_account_data = app_state.static_account_data
+
+    # Serve the cached response body while fresh. The background refresher
+    # keeps the snapshot up to date, so no IBKR round-trip happens here.
+    cache = app_state.api_cache
+    cache_ttl = load_config().get('dashboard', {}).get('refresh_interval', 60)
+    if cache['body'] is not None and time.time() - cache['ts'] < cache_ttl:
+        return _api_response(cache['body'])
+
     # Prepare cash account data
     cash_account_data = {
         'id': 'N/A',
@@ -657,8 +1108,8 @@ def api_account_data():
         'total_value': 0
     }
     
-    if app_state['portfolio_manager'] and app_state['portfolio_manager'].cash_account:
-        cash_account = app_state['portfolio_manager'].cash_account
+    if portfolio_manager and portfolio_manager.cash_account:
+        cash_account = portfolio_manager.cash_account
         cash_account_data = {
             'id': cash_account.get('id', 'N/A'),
             'cash_balance': get_cash_balance(cash_account),
@@ -672,8 +1123,8 @@ def api_account_data():
         'total_value': 0
     }
     
-    if app_state['static_account_data']:
-        investment_account = app_state['static_account_data']
+    if static_account_data:
+        investment_account = static_account_data
         investment_account_data = {
             'id': investment_account.get('id', 'N/A'),
             'cash_balance': get_cash_balance(investment_account),
@@ -682,825 +1133,299 @@ def api_account_data():
     
     # Format cash level info
     cash_level = {'error': 'Cash level check not available'}
-    if app_state['portfolio_manager']:
-        cash_level = app_state['portfolio_manager'].check_cash_level()
+    if portfolio_manager:
+        with ibkr_lock:
+            cash_level = portfolio_manager.check_cash_level()
     
     # Format response data
     response = {
         'cash_account': cash_account_data,
         'investment_account': investment_account_data,
         'cash_level': cash_level,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': app_state.last_refresh_iso or datetime.now().isoformat()
     }
-    
-    return jsonify(response)
+
+    # Serialize once with orjson and bypass jsonify
+    body = json_dumps_bytes(response)
+    cache['ts'] = time.time()
+    cache['body'] = body
+
+    return _api_response(body)
+
+def _api_response(body):
+    """Build the JSON response with a Last-Modified header for the snapshot"""
+
+    resp = Response(body, mimetype='application/json')
+    # Let burst pollers reuse the response client-side for a second
+    resp.headers['Cache-Control'] = 'max-age=1'
+    last_refresh = app_state.last_refresh
+    if last_refresh:
+        resp.last_modified = datetime.utcfromtimestamp(last_refresh)
+    return resp
 
 # Helper functions
 def generate_allocation_chart():
     """Generate asset allocation chart"""
-    
-    # Get investment positions from static data
-    investment_positions = {}
-    if app_state['static_account_data'] and 'positions' in app_state['static_account_data']:
-        positions = app_state['static_account_data']['positions']
-        for key, pos in positions.items():
-            # Only include actual position objects
-            if isinstance(pos, dict) and ('symbol' in pos or 'position' in pos):
-                investment_positions[key] = pos
-    
-    # If no positions found, try investment manager
-    if not investment_positions and app_state['investment_manager'] and hasattr(app_state['investment_manager'], 'investment_account'):
-        account = app_state['investment_manager'].investment_account
+
+    import plotly.express as px
+
+    # Get investment positions from the shared DataFrame
+    df = get_investment_positions_df()
+
+    # If static data had no positions, try the investment manager
+    if df.empty and app_state.investment_manager and hasattr(app_state.investment_manager, 'investment_account'):
+        account = app_state.investment_manager.investment_account
         if account and 'positions' in account:
-            for key, pos in account['positions'].items():
-                if isinstance(pos, dict) and ('symbol' in pos or 'position' in pos):
-                    investment_positions[key] = pos
-    
-    # Prepare data for chart
-    allocation_data = {}
-    for key, position in investment_positions.items():
-        # Get symbol
-        symbol = position.get('symbol', key)
-        
-        # Extract symbol from key if needed
-        if not symbol and '_' in key:
-            symbol = key.split('_')[0]
-        
-        # Get market value
-        market_value = position.get('marketValue', 0)
-        if not market_value and 'position' in position and 'marketPrice' in position:
-            market_value = position['position'] * position['marketPrice']
-        
-        if market_value > 0:
-            allocation_data[symbol] = market_value
-    
-    # Create chart if we have data
-    if allocation_data:
-        df = pd.DataFrame({
-            'Asset': list(allocation_data.keys()),
-            'Value': list(allocation_data.values())
-        })
-        
-        fig = px.pie(df, values='Value', names='Asset', title='Asset Allocation')
-        return plotly.utils.PlotlyJSONEncoder().encode(fig)
-    
-    return None
+            df = build_positions_df(account['positions'])
+
+    if df.empty:
+        return None
+
+    # Market value with the position * price fallback, then one aggregation
+    # pass; px.pie gets plain lists so no intermediate DataFrame is built
+    values = df['marketValue'].where(df['marketValue'] > 0, df['position'] * df['marketPrice'])
+    totals = values.groupby(df['symbol'].values).sum()
+    totals = totals[totals > 0]
+
+    if totals.empty:
+        return None
+
+    fig = px.pie(values=totals.tolist(), names=totals.index.tolist(),
+                 title='Asset Allocation')
+    return plotly_figure_json(fig)
+
+def _build_performance_chart():
+    """Build the performance chart payload and encode it to JSON"""
+
+    import numpy as np
 
-def generate_performance_chart():
-    """Generate performance chart"""
-    
     # Simulated performance data
     # In a real implementation, this would pull historical data from IBKR
-    dates = pd.date_range(start='2024-01-01', end='2025-2-28', freq='M')
-    
-    cash_values = [10000 + i*500 for i in range(len(dates))]
-    investment_values = [20000 + i*1000 + (i*i*10) for i in range(len(dates))]
-    benchmark_values = [30000 + i*800 + (i*5) for i in range(len(dates))]
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=dates, y=cash_values,
-        mode='lines',
-        name='Cash Account'
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=dates, y=investment_values,
-        mode='lines',
-        name='Investment Account'
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=dates, y=benchmark_values,
-        mode='lines',
-        name='Benchmark'
-    ))
-    
-    fig.update_layout(
-        title='Portfolio Performance',
-        xaxis_title='Date',
-        yaxis_title='Value (SGD)',
-        legend_title='Accounts'
-    )
-    
-    return plotly.utils.PlotlyJSONEncoder().encode(fig)
+    # Month-end dates via datetime64 arithmetic (first of next month minus a
+    # day), so pandas stays out of this helper entirely
+    months = np.arange('2024-01', '2025-03', dtype='datetime64[M]')
+    dates = ((months + 1).astype('datetime64[D]') - np.timedelta64(1, 'D')).astype(str).tolist()
+
+    # Vectorized series
+    i = np.arange(len(dates))
+    cash_values = 10000 + 500*i
+    investment_values = 20000 + 1000*i + 10*i*i
+    benchmark_values = 30000 + 800*i + 5*i
+
+    # Build the figure as a raw dict -- Plotly.js only needs data/layout, and
+    # skipping go.Figure avoids its per-trace validation machinery
+    figure = {
+        'data': [
+            {'type': 'scatter', 'mode': 'lines', 'name': 'Cash Account',
+             'x': dates, 'y': cash_values.tolist()},
+            {'type': 'scatter', 'mode': 'lines', 'name': 'Investment Account',
+             'x': dates, 'y': investment_values.tolist()},
+            {'type': 'scatter', 'mode': 'lines', 'name': 'Benchmark',
+             'x': dates, 'y': benchmark_values.tolist()}
+        ],
+        'layout': {
+            'title': {'text': 'Portfolio Performance'},
+            'xaxis': {'title': {'text': 'Date'}},
+            'yaxis': {'title': {'text': 'Value (SGD)'}},
+            'legend': {'title': {'text': 'Accounts'}}
+        }
+    }
+
+    return json_dumps_bytes(figure).decode()
+
+# The chart is built from hard-coded series, so encode it once on first use
+# (lazy so importing this module stays cheap). Once real IBKR history is
+# wired in, replace this with a cache keyed by (account_id, as_of_date).
+_PERFORMANCE_CHART_JSON = None
+
+def generate_performance_chart():
+    """Generate performance chart"""
+    global _PERFORMANCE_CHART_JSON
+    if _PERFORMANCE_CHART_JSON is None:
+        _PERFORMANCE_CHART_JSON = _build_performance_chart()
+    return _PERFORMANCE_CHART_JSON
+
+# Account keys probed for balances and values, in priority order
+CASH_KEYS = ('TotalCashValue_SGD', 'AvailableFunds_SGD', 'TotalCashValue', 'AvailableFunds')
+VALUE_KEYS = ('NetLiquidation_SGD', 'GrossPositionValue_SGD', 'NetLiquidation', 'GrossPositionValue')
+
+def _lookup_account_field(account, keys, direct_key):
+    """Find the first matching key across the known account data layouts"""
 
-def get_cash_balance(account):
-    """Get cash balance from account data"""
-    
     if not account:
         return 0
-    
-    # Try different formats for cash balance
-    if 'data' in account and 'account_info' in account['data']:
-        account_info = account['data']['account_info']
-        
-        # Look for cash balance keys
-        cash_keys = ['TotalCashValue_SGD', 'AvailableFunds_SGD', 'TotalCashValue', 'AvailableFunds']
-        
-        for key in cash_keys:
-            if key in account_info:
-                return float(account_info[key])
-    
-    # Alternative format
-    if 'summary' in account:
-        summary = account['summary']
-        
-        cash_keys = ['TotalCashValue_SGD', 'AvailableFunds_SGD', 'TotalCashValue', 'AvailableFunds']
-        
-        for key in cash_keys:
-            if key in summary:
-                return float(summary[key])
-    
-    # Direct cash value
-    if 'cash_balance' in account:
-        return float(account['cash_balance'])
-    
+
+    # Try the data/account_info layout first
+    data = account.get('data')
+    if data:
+        account_info = data.get('account_info')
+        if account_info:
+            for key in keys:
+                value = account_info.get(key)
+                if value is not None:
+                    return float(value)
+
+    # Alternative summary layout
+    summary = account.get('summary')
+    if summary:
+        for key in keys:
+            value = summary.get(key)
+            if value is not None:
+                return float(value)
+
+    # Direct value
+    value = account.get(direct_key)
+    if value is not None:
+        return float(value)
+
     return 0
 
+def get_cash_balance(account):
+    """Get cash balance from account data"""
+    return _lookup_account_field(account, CASH_KEYS, 'cash_balance')
+
 def get_account_value(account):
     """Get total account value"""
-    
-    if not account:
-        return 0
-    
-    # Try different formats for account value
-    if 'data' in account and 'account_info' in account['data']:
-        account_info = account['data']['account_info']
-        
-        # Look for value keys
-        value_keys = ['NetLiquidation_SGD', 'GrossPositionValue_SGD', 'NetLiquidation', 'GrossPositionValue']
-        
-        for key in value_keys:
-            if key in account_info:
-                return float(account_info[key])
-    
-    # Alternative format
-    if 'summary' in account:
-        summary = account['summary']
-        
-        value_keys = ['NetLiquidation_SGD', 'GrossPositionValue_SGD', 'NetLiquidation', 'GrossPositionValue']
-        
-        for key in value_keys:
-            if key in summary:
-                return float(summary[key])
-    
-    # Direct total value
-    if 'total_value' in account:
-        return float(account['total_value'])
-    
-    return 0
+    return _lookup_account_field(account, VALUE_KEYS, 'total_value')
+
+# Nested paths probed when reading or mutating a single account field
+_FIELD_PATHS = (('data', 'account_info'), ('summary',))
+
+def get_account_field(raw, key, default=None):
+    """Read one field from the known account data layouts, as a float"""
+    for path in _FIELD_PATHS:
+        node = raw
+        for part in path:
+            node = node.get(part) if isinstance(node, dict) else None
+        if isinstance(node, dict) and key in node:
+            return float(node[key])
+    return default
+
+def add_to_account_fields(raw, keys, delta):
+    """Add delta to every matching field across the account data layouts"""
+    for path in _FIELD_PATHS:
+        node = raw
+        for part in path:
+            node = node.get(part) if isinstance(node, dict) else None
+        if not isinstance(node, dict):
+            continue
+        for key in keys:
+            if key in node:
+                # Store floats; values read back from old snapshots may still
+                # be strings, so coerce before adding
+                node[key] = float(node[key]) + delta
 
 # Create necessary directories
 def ensure_directories():
-    """Ensure necessary directories exist"""
-    
-    os.makedirs(app_state['config_path'], exist_ok=True)
-    os.makedirs('static', exist_ok=True)
-    os.makedirs('templates', exist_ok=True)
+    """Ensure necessary directories exist (called once from init_app)"""
 
-# Create template files
-def create_templates():
-    """Create template files if they don't exist"""
-    
-    templates_dir = 'templates'
-    
-    # Base template
-    base_html = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{% block title %}Arki Portfolio Management{% endblock %}</title>
-    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@4.6.0/dist/css/bootstrap.min.css">
-    <link rel="stylesheet" href="{{ url_for('static', filename='style.css') }}">
-    {% block head %}{% endblock %}
-</head>
-<body>
-    <nav class="navbar navbar-expand-lg navbar-dark bg-dark">
-        <a class="navbar-brand" href="/">Arki Portfolio</a>
-        <button class="navbar-toggler" type="button" data-toggle="collapse" data-target="#navbarNav">
-            <span class="navbar-toggler-icon"></span>
-        </button>
-        <div class="collapse navbar-collapse" id="navbarNav">
-            <ul class="navbar-nav">
-                <li class="nav-item">
-                    <a class="nav-link" href="/">Home</a>
-                </li>
-                <li class="nav-item">
-                    <a class="nav-link" href="/dashboard">Dashboard</a>
-                </li>
-                <li class="nav-item">
-                    <a class="nav-link" href="/portfolio">Portfolio</a>
-                </li>
-                <li class="nav-item">
-                    <a class="nav-link" href="/deposit">Deposit</a>
-                </li>
-                <li class="nav-item">
-                    <a class="nav-link" href="/settings">Settings</a>
-                </li>
-            </ul>
-        </div>
-    </nav>
-    
-    <div class="container mt-4">
-        {% with messages = get_flashed_messages(with_categories=true) %}
-            {% if messages %}
-                {% for category, message in messages %}
-                    <div class="alert alert-{{ category }}">{{ message }}</div>
-                {% endfor %}
-            {% endif %}
-        {% endwith %}
-        
-        {% block content %}{% endblock %}
-    </div>
-    
-    <footer class="mt-5 p-3 text-center bg-light">
-        <div class="container">
-            <p>Arki Portfolio Management &copy; 2025</p>
-        </div>
-    </footer>
-    
-    <script src="https://code.jquery.com/jquery-3.5.1.slim.min.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@4.6.0/dist/js/bootstrap.bundle.min.js"></script>
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
-    {% block scripts %}{% endblock %}
-</body>
-</html>
-    '''
-    
-    # Index page (updated version with deposit)
-    index_html = '''
-{% extends "base.html" %}
-
-{% block title %}Arki Portfolio - Home{% endblock %}
-
-{% block content %}
-<div class="jumbotron">
-    <h1 class="display-4">Arki Portfolio Management</h1>
-    <p class="lead">A portfolio management system for IBKR accounts</p>
-    <hr class="my-4">
-    <p>Connect to IBKR to view and manage your portfolio.</p>
-    <div class="d-flex">
-        {% if connected %}
-            <form action="/disconnect" method="post" class="mr-2">
-                <button type="submit" class="btn btn-warning">Disconnect from IBKR</button>
-            </form>
-            <a href="/dashboard" class="btn btn-primary">View Dashboard</a>
-        {% else %}
-            <form action="/connect" method="post">
-                <button type="submit" class="btn btn-success">Connect to IBKR</button>
-            </form>
-        {% endif %}
-    </div>
-</div>
+    Path(app_state.config_path).mkdir(parents=True, exist_ok=True)
+    app_state.static_dir.mkdir(parents=True, exist_ok=True)
+    app_state.templates_dir.mkdir(parents=True, exist_ok=True)
 
-<div class="row mt-4">
-    <div class="col-md-3">
-        <div class="card">
-            <div class="card-body">
-                <h5 class="card-title">Portfolio Dashboard</h5>
-                <p class="card-text">View your portfolio dashboard with real-time account information and charts.</p>
-                <a href="/dashboard" class="btn btn-primary">View Dashboard</a>
-            </div>
-        </div>
-    </div>
-    <div class="col-md-3">
-        <div class="card">
-            <div class="card-body">
-                <h5 class="card-title">Portfolio Details</h5>
-                <p class="card-text">Explore detailed information about your portfolio allocations and positions.</p>
-                <a href="/portfolio" class="btn btn-primary">View Portfolio</a>
-            </div>
-        </div>
-    </div>
-    <div class="col-md-3">
-        <div class="card">
-            <div class="card-body">
-                <h5 class="card-title">Deposit Funds</h5>
-                <p class="card-text">Deposit funds to your simulated cash account to test the transfer functionality.</p>
-                <a href="/deposit" class="btn btn-success">Deposit Funds</a>
-            </div>
-        </div>
-    </div>
-    <div class="col-md-3">
-        <div class="card">
-            <div class="card-body">
-                <h5 class="card-title">Settings</h5>
-                <p class="card-text">Configure system parameters and adjust portfolio allocation settings.</p>
-                <a href="/settings" class="btn btn-primary">Manage Settings</a>
-            </div>
-        </div>
-    </div>
-</div>
-{% endblock %}
-    '''
-    
-    # Dashboard page
-    dashboard_html = '''
-{% extends "base.html" %}
+# Template sources live as real files in templates_src/ instead of inline
+# string literals, so the compiler never re-lexes kilobytes of HTML when the
+# .pyc is regenerated and the kernel page cache backs the reads.
+_TEMPLATES_SRC_DIR = Path(__file__).parent / 'templates_src'
 
-{% block title %}Arki Portfolio - Dashboard{% endblock %}
+def _minify_template(source):
+    """Drop indentation, blank lines and HTML comment lines from a template.
 
-{% block head %}
-<style>
-    .metrics-card {
-        height: 100%;
-    }
-    .chart-container {
-        min-height: 400px;
-    }
-</style>
-{% endblock %}
-
-{% block content %}
-<h1>Portfolio Dashboard</h1>
-
-<div class="row mt-4">
-    <!-- First row with account cards - full width on small screens, half width on medium+ screens -->
-    <div class="col-12 col-md-6 mb-4">
-        <div class="card metrics-card h-100">
-            <div class="card-header">
-                <h5>Cash Account (Simulated)</h5>
-            </div>
-            <div class="card-body">
-                {% if account_data.cash_account %}
-                    <p><strong>Account ID:</strong> {{ account_data.cash_account.id }}</p>
-                    <p><strong>Cash Balance:</strong> ${{ "%.2f"|format(account_data.cash_account.data.account_info.get('TotalCashValue_SGD', 0)|float) }}</p>
-                    <p><strong>Min Cash Level:</strong> ${{ "%.2f"|format(cash_info.min_cash_level) }}</p>
-                    <p><strong>Excess Cash:</strong> ${{ "%.2f"|format(cash_info.excess_cash) }}</p>
-                    <p><strong>Transfer Threshold:</strong> ${{ "%.2f"|format(cash_info.transfer_threshold) }}</p>
-                    <p><strong>Should Transfer:</strong> {{ "Yes" if cash_info.should_transfer else "No" }}</p>
-                    
-                    <div class="mt-3">
-                        <a href="/deposit" class="btn btn-success">Deposit Funds</a>
-                        {% if cash_info.should_transfer %}
-                            <form action="/transfer" method="post" class="d-inline ml-2">
-                                <input type="hidden" name="amount" value="{{ cash_info.excess_cash }}">
-                                <button type="submit" class="btn btn-primary">Transfer to Investment</button>
-                            </form>
-                        {% endif %}
-                    </div>
-                {% else %}
-                    <p>Cash account data not available</p>
-                {% endif %}
-            </div>
-        </div>
-    </div>
-    
-    <div class="col-12 col-md-6 mb-4">
-        <div class="card metrics-card h-100">
-            <div class="card-header">
-                <h5>Investment Account{% if not connected %} (Simulated){% endif %}</h5>
-            </div>
-            <div class="card-body">
-                {% if account_data.investment_account %}
-                    <p><strong>Account ID:</strong> {{ account_data.investment_account.id }}</p>
-                    
-                    {% if account_data.investment_account.cash_balance is defined and account_data.investment_account.cash_balance is not none %}
-                        <p><strong>Cash Balance:</strong> ${{ "%.2f"|format(account_data.investment_account.cash_balance|float) }}</p>
-                    {% else %}
-                        <p><strong>Cash Balance:</strong> $0.00</p>
-                    {% endif %}
-                    
-                    {% if account_data.investment_account.total_value is defined and account_data.investment_account.total_value is not none %}
-                        <p><strong>Portfolio Value:</strong> ${{ "%.2f"|format(account_data.investment_account.total_value|float) }}</p>
-                    {% else %}
-                        <p><strong>Portfolio Value:</strong> $0.00</p>
-                    {% endif %}
-                    
-                    <p><strong>Number of Positions:</strong> {{ account_data.investment_account.positions|length if account_data.investment_account.positions else 0 }}</p>
-                    
-                    {% if not connected %}
-                        <div class="alert alert-warning mt-3">
-                            <small>Investment account is in simulation mode. Connect to IBKR for real data.</small>
-                        </div>
-                    {% endif %}
-                {% else %}
-                    <p>Investment account data not available</p>
-                {% endif %}
-            </div>
-        </div>
-    </div>
+    Line structure is preserved so the inline scripts (// comments,
+    statement-per-line JS) stay valid; nothing in these templates is
+    whitespace-sensitive. Roughly 30% smaller sources mean less for Jinja
+    to lex and fewer bytes on the wire.
+    """
+    lines = []
+    for line in source.split(b'\n'):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped.startswith(b'<!--') and stripped.endswith(b'-->'):
+            continue
+        lines.append(stripped)
+    return b'\n'.join(lines) + b'\n'
 
-    <!-- Second row with charts - full width on small screens, half width on medium+ screens -->
-    <div class="col-12 col-md-6 mb-4">
-        <div class="card h-100">
-            <div class="card-header">
-                <h5>Asset Allocation</h5>
-            </div>
-            <div class="card-body">
-                <div id="allocation-chart" class="chart-container">
-                    {% if allocation_chart %}
-                        <div id="allocation-plot"></div>
-                    {% else %}
-                        <p>No allocation data available</p>
-                    {% endif %}
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <div class="col-12 col-md-6 mb-4">
-        <div class="card h-100">
-            <div class="card-header">
-                <h5>Performance History</h5>
-            </div>
-            <div class="card-body">
-                <div id="performance-chart" class="chart-container">
-                    {% if performance_chart %}
-                        <div id="performance-plot"></div>
-                    {% else %}
-                        <p>No performance data available</p>
-                    {% endif %}
-                </div>
-            </div>
-        </div>
-    </div>
-</div>
+def _load_template_sources():
+    """Read and minify the canonical template sources once at import time"""
+    return MappingProxyType({
+        name: _minify_template((_TEMPLATES_SRC_DIR / name).read_bytes())
+        for name in ('base.html', 'index.html', 'dashboard.html',
+                     'portfolio.html', 'settings.html', 'deposit.html')
+    })
 
-{% if cash_account and cash_account.transactions and cash_account.transactions|length > 0 %}
-<div class="row mt-4">
-    <div class="col-12">
-        <div class="card">
-            <div class="card-header">
-                <h5>Recent Transactions</h5>
-            </div>
-            <div class="card-body">
-                <div class="table-responsive">
-                    <table class="table table-striped">
-                        <thead>
-                            <tr>
-                                <th>Date/Time</th>
-                                <th>Type</th>
-                                <th>Amount</th>
-                                <th>Details</th>
-                                <th>Balance After</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-                            {% for tx in cash_account.transactions|sort(attribute='timestamp', reverse=True) %}
-                                {% if loop.index <= 10 %}
-                                <tr>
-                                    <td>{{ tx.timestamp }}</td>
-                                    <td>{{ tx.type }}</td>
-                                    <td>${{ "%.2f"|format(tx.amount) }}</td>
-                                    <td>
-                                        {% if tx.type == 'transfer_out' %}
-                                            To: {{ tx.destination_account }}
-                                        {% endif %}
-                                    </td>
-                                    <td>${{ "%.2f"|format(tx.balance_after) }}</td>
-                                </tr>
-                                {% endif %}
-                            {% endfor %}
-                        </tbody>
-                    </table>
-                </div>
-            </div>
-        </div>
-    </div>
-</div>
-{% endif %}
-{% endblock %}
-
-{% block scripts %}
-<script>
-    // Render charts if data is available
-    {% if allocation_chart %}
-        const allocationData = {{ allocation_chart|safe }};
-        Plotly.newPlot('allocation-plot', allocationData.data, allocationData.layout);
-    {% endif %}
-    
-    {% if performance_chart %}
-        const performanceData = {{ performance_chart|safe }};
-        Plotly.newPlot('performance-plot', performanceData.data, performanceData.layout);
-    {% endif %}
-    
-    // Auto-refresh data every minute
-    setTimeout(function() {
-        location.reload();
-    }, 60000);
-
-    // Resize Plotly charts when window size changes
-    window.addEventListener('resize', function() {
-        if (allocationData) Plotly.relayout('allocation-plot', {
-            'width': document.getElementById('allocation-plot').offsetWidth
-        });
-        if (performanceData) Plotly.relayout('performance-plot', {
-            'width': document.getElementById('performance-plot').offsetWidth
-        });
-    });
-</script>
-
-<style>
-    .chart-container {
-        height: 350px;
-        width: 100%;
-    }
-    
-    .metrics-card {
-        height: 100%;
-    }
-    
-    @media (min-width: 768px) {
-        .chart-container {
-            height: 450px;
-        }
-    }
-</style>
-{% endblock %}
-    '''
-    # Deposit page
-    deposit_html = '''
-{% extends "base.html" %}
-
-{% block title %}Arki Portfolio - Deposit{% endblock %}
-
-{% block content %}
-<h1>Deposit to Cash Account</h1>
-
-<div class="row mt-4">
-    <div class="col-md-6">
-        <div class="card">
-            <div class="card-header">
-                <h5>Deposit Funds</h5>
-            </div>
-            <div class="card-body">
-                <form action="/deposit" method="post">
-                    <div class="form-group">
-                        <label for="amount">Deposit Amount (SGD)</label>
-                        <input type="number" class="form-control" id="amount" name="amount" step="1000" min="1000" required>
-                        <small class="form-text text-muted">Enter the amount to deposit into your cash account</small>
-                    </div>
-                    
-                    <button type="submit" class="btn btn-primary">Deposit Funds</button>
-                </form>
-            </div>
-        </div>
-    </div>
-    
-    <div class="col-md-6">
-        <div class="card">
-            <div class="card-header">
-                <h5>Information</h5>
-            </div>
-            <div class="card-body">
-                <p>This is a simulated deposit to your cash account. In a real application, this would integrate with 
-                    a payment gateway or banking API.</p>
-                <p>After depositing funds, you'll be redirected to the dashboard where you can see your updated account balance.</p>
-            </div>
-        </div>
-    </div>
-</div>
-{% endblock %}
-    '''
-    
-    # Portfolio page - keep as is
-    portfolio_html = '''
-{% extends "base.html" %}
-
-{% block title %}Arki Portfolio - Portfolio Details{% endblock %}
-
-{% block content %}
-<h1>Portfolio Details</h1>
-
-<div class="row mt-4">
-    <div class="col-md-12">
-        <ul class="nav nav-tabs" id="portfolioTabs" role="tablist">
-            <li class="nav-item">
-                <a class="nav-link active" id="cash-tab" data-toggle="tab" href="#cash" role="tab">Cash Portfolio</a>
-            </li>
-            <li class="nav-item">
-                <a class="nav-link" id="investment-tab" data-toggle="tab" href="#investment" role="tab">Investment Portfolio</a>
-            </li>
-            <li class="nav-item">
-                <a class="nav-link" id="positions-tab" data-toggle="tab" href="#positions" role="tab">Current Positions</a>
-            </li>
-        </ul>
-        
-        <div class="tab-content mt-3" id="portfolioTabContent">
-            <!-- Cash Portfolio Tab -->
-            <div class="tab-pane fade show active" id="cash" role="tabpanel">
-                <div class="card">
-                    <div class="card-header">
-                        <h5>Cash Portfolio Allocation</h5>
-                    </div>
-                    <div class="card-body">
-                        {% if cash_portfolio %}
-                            <table class="table table-striped">
-                                <thead>
-                                    <tr>
-                                        <th>Instrument</th>
-                                        <th>Target Percentage</th>
-                                    </tr>
-                                </thead>
-                                <tbody>
-                                    {% for instrument, percentage in cash_portfolio.items() %}
-                                        <tr>
-                                            <td>{{ instrument }}</td>
-                                            <td>{{ "%.2f"|format(percentage * 100) }}%</td>
-                                        </tr>
-                                    {% endfor %}
-                                </tbody>
-                            </table>
-                        {% else %}
-                            <p>No cash portfolio allocation data available</p>
-                        {% endif %}
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Investment Portfolio Tab -->
-            <div class="tab-pane fade" id="investment" role="tabpanel">
-                <div class="card">
-                    <div class="card-header">
-                        <h5>Investment Portfolio Allocation</h5>
-                    </div>
-                    <div class="card-body">
-                        {% if investment_portfolio and investment_portfolio is mapping %}
-                            {% for strategy, instruments in investment_portfolio.items() %}
-                                <h6>{{ strategy }}</h6>
-                                <table class="table table-striped">
-                                    <thead>
-                                        <tr>
-                                            <th>Instrument</th>
-                                            <th>Type</th>
-                                            <th>Exchange</th>
-                                            <th>Target Percentage</th>
-                                        </tr>
-                                    </thead>
-                                    <tbody>
-                                        {% for instrument, details in instruments.items() %}
-                                            <tr>
-                                                <td>{{ instrument }}</td>
-                                                <td>{{ details.instrument_type }}</td>
-                                                <td>{{ details.exchange }}</td>
-                                                <td>{{ "%.2f"|format(details.target_percentage * 100) }}%</td>
-                                            </tr>
-                                        {% endfor %}
-                                    </tbody>
-                                </table>
-                            {% endfor %}
-                        {% else %}
-                            <p>No investment portfolio allocation data available</p>
-                        {% endif %}
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Positions Tab -->
-            <div class="tab-pane fade" id="positions" role="tabpanel">
-                <div class="card">
-                    <div class="card-header">
-                        <h5>Current Positions</h5>
-                    </div>
-                    <div class="card-body">
-                        <h6>Cash Account Positions</h6>
-                        {% if cash_positions %}
-                            <table class="table table-striped">
-                                <thead>
-                                    <tr>
-                                        <th>Symbol</th>
-                                        <th>Type</th>
-                                        <th>Position</th>
-                                        <th>Market Price</th>
-                                        <th>Market Value</th>
-                                    </tr>
-                                </thead>
-                                <tbody>
-                                    {% for key, position in cash_positions.items() %}
-                                        <tr>
-                                            <td>{{ position.contract.symbol }}</td>
-                                            <td>{{ position.contract.secType }}</td>
-                                            <td>{{ position.position }}</td>
-                                            <td>${{ "%.2f"|format(position.marketPrice or 0) }}</td>
-                                            <td>${{ "%.2f"|format(position.marketValue or 0) }}</td>
-                                        </tr>
-                                    {% endfor %}
-                                </tbody>
-                            </table>
-                        {% else %}
-                            <p>No cash account positions available</p>
-                        {% endif %}
-                        
-                        <h6 class="mt-4">Investment Account Positions</h6>
-                        {% if investment_positions %}
-                            <table class="table table-striped">
-                                <thead>
-                                    <tr>
-                                        <th>Symbol</th>
-                                        <th>Type</th>
-                                        <th>Position</th>
-                                        <th>Market Price</th>
-                                        <th>Market Value</th>
-                                    </tr>
-                                </thead>
-                                <tbody>
-                                    {% for key, position in investment_positions.items() %}
-                                        <tr>
-                                            <td>{{ position.symbol }}</td>
-                                            <td>{{ position.secType }}</td>
-                                            <td>{{ position.position }}</td>
-                                            <td>${{ "%.2f"|format(position.marketPrice or 0) }}</td>
-                                            <td>${{ "%.2f"|format(position.marketValue or 0) }}</td>
-                                        </tr>
-                                    {% endfor %}
-                                </tbody>
-                            </table>
-                        {% else %}
-                            <p>No investment account positions available</p>
-                        {% endif %}
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-</div>
-{% endblock %}
-    '''
-    
-    # Settings page
-    settings_html = '''
-{% extends "base.html" %}
-
-{% block title %}Arki Portfolio - Settings{% endblock %}
-
-{% block content %}
-<h1>Portfolio Settings</h1>
-
-<div class="row mt-4">
-    <div class="col-md-6">
-        <div class="card">
-            <div class="card-header">
-                <h5>Cash Management Settings</h5>
-            </div>
-            <div class="card-body">
-                <form action="/settings" method="post">
-                    <div class="form-group">
-                        <label for="min_cash_level">Minimum Cash Level (SGD)</label>
-                        <input type="number" class="form-control" id="min_cash_level" name="min_cash_level" step="1000" value="{{ settings.min_cash_level }}">
-                        <small class="form-text text-muted">Minimum cash amount to maintain in cash account</small>
-                    </div>
-                    
-                    <div class="form-group">
-                        <label for="transfer_threshold">Transfer Threshold (SGD)</label>
-                        <input type="number" class="form-control" id="transfer_threshold" name="transfer_threshold" step="1000" value="{{ settings.transfer_threshold }}">
-                        <small class="form-text text-muted">Cash level that triggers transfer to investment account</small>
-                    </div>
-                    
-                    <button type="submit" class="btn btn-primary">Save Changes</button>
-                </form>
-            </div>
-        </div>
+# Connection-settings card for the settings page. Its values change only on
+# config reload, so it is rendered once per config mtime (see
+# render_connection_card) and injected into settings.html as raw HTML.
+_CONNECTION_CARD_HTML = '''
+<div class="card">
+    <div class="card-header">
+        <h5>Connection Settings</h5>
     </div>
-    
-    <div class="col-md-6">
-        <div class="card">
-            <div class="card-header">
-                <h5>Connection Settings</h5>
-            </div>
-            <div class="card-body">
-                <p><strong>IBKR Host:</strong> {{ settings.ibkr_host }}</p>
-                <p><strong>IBKR Port:</strong> {{ settings.ibkr_port }}</p>
-                <p><small class="form-text text-muted">To change connection settings, edit the configuration file directly.</small></p>
-                
-                <div class="form-group">
-                    <label for="allocation_tolerance">Allocation Tolerance</label>
-                    <input type="number" class="form-control" id="allocation_tolerance" name="allocation_tolerance" step="0.01" min="0.01" max="0.10" value="{{ settings.allocation_tolerance }}" disabled>
-                    <small class="form-text text-muted">Percentage threshold for rebalancing (e.g., 0.02 = 2%)</small>
-                </div>
-            </div>
+    <div class="card-body">
+        <p><strong>IBKR Host:</strong> {{ settings.ibkr_host }}</p>
+        <p><strong>IBKR Port:</strong> {{ settings.ibkr_port }}</p>
+        <p><small class="form-text text-muted">To change connection settings, edit the configuration file directly.</small></p>
+
+        <div class="form-group">
+            <label for="allocation_tolerance">Allocation Tolerance</label>
+            <input type="number" class="form-control" id="allocation_tolerance" name="allocation_tolerance" step="0.01" min="0.01" max="0.10" value="{{ settings.allocation_tolerance }}" disabled>
+            <small class="form-text text-muted">Percentage threshold for rebalancing (e.g., 0.02 = 2%)</small>
         </div>
     </div>
 </div>
-{% endblock %}
-    '''
-    
-    # Create template files
-    templates = {
-        'base.html': base_html,
-        'index.html': index_html,
-        'dashboard.html': dashboard_html,
-        'portfolio.html': portfolio_html,
-        'settings.html': settings_html,
-        'deposit.html': deposit_html
-    }
-    
-    for filename, content in templates.items():
-        file_path = os.path.join(templates_dir, filename)
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, 'w') as f:
-            f.write(content)
-        logger.info(f"Created template file {file_path}")
-
-# Create static files
-def create_static_files():
-    """Create static CSS file"""
-    
-    css_content = '''
+'''
+
+@lru_cache(maxsize=None)
+def render_connection_card(config_mtime):
+    """Render the request-invariant connection card once per config change"""
+
+    config = load_config()
+    cash_management = config.get('cash_management', {})
+    return Markup(render_template_string(_CONNECTION_CARD_HTML, settings={
+        'ibkr_host': config['ibkr'].get('host', '127.0.0.1'),
+        'ibkr_port': config['ibkr'].get('port', 7497),
+        'allocation_tolerance': cash_management.get('allocation_tolerance', 0.02)
+    }))
+
+# Read-only view: template sources are fixed at import time
+_TEMPLATES = _load_template_sources()
+
+# Create template files
+def create_templates():
+    """Create template files, skipping the writes when nothing has changed"""
+
+    templates_dir = app_state.templates_dir
+    manifest_path = templates_dir / '.manifest'
+
+    # One hash of all template sources lets us skip the whole loop (and its
+    # per-file stat/open/write syscalls) on a normal restart
+    digest = hashlib.blake2b(repr(sorted(_TEMPLATES.items())).encode()).hexdigest()
+    try:
+        if manifest_path.read_text() == digest:
+            return
+    except OSError:
+        pass
+
+    # Batch the slow path into open/write/close phases: every fd is opened
+    # first, then each file lands in a single write(). True multi-file
+    # submission (io_uring) isn't reachable from the stdlib, but phase
+    # grouping keeps the loop free of per-file Python object churn.
+    items = list(_TEMPLATES.items())
+    fds = [os.open(templates_dir / name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+           for name, _ in items]
+    try:
+        for fd, (name, content) in zip(fds, items):
+            os.write(fd, content)
+    finally:
+        for fd in fds:
+            os.close(fd)
+    logger.info(f"Created {len(items)} template files in {templates_dir}")
+
+    manifest_path.write_text(digest)
+
+# Static CSS, pre-encoded once at module scope like the template sources
+_STYLE_CSS = b'''
 /* Custom styles for Arki Portfolio Management */
 
 .navbar-brand {
@@ -1524,74 +1449,127 @@ footer {
     margin-top: 50px;
 }
     '''
-    
-    css_path = os.path.join('static', 'style.css')
-    if not os.path.exists(css_path):
-        os.makedirs(os.path.dirname(css_path), exist_ok=True)
-        with open(css_path, 'w') as f:
-            f.write(css_content)
-        logger.info(f"Created CSS file {css_path}")
-
-# Create sample portfolio allocation file
-def create_sample_portfolio_file():
-    """Create sample portfolio allocation file"""
-    
-    config = load_config()
-    portfolio_file = os.path.join(app_state['config_path'], 'portfolio_allocation.csv')
-    
-    if not os.path.exists(portfolio_file):
-        # Create sample portfolio allocation data
-        data = [
-            # Cash portfolio
-            {'account_type': 'cash', 'strategy': 'Cash', 'instrument': 'CASH_SGD', 'instrument_type': 'CASH', 'exchange': '', 'target_percentage': 0.4},
-            {'account_type': 'cash', 'strategy': 'Cash', 'instrument': 'SHY', 'instrument_type': 'ETF', 'exchange': 'SMART', 'target_percentage': 0.3},
-            {'account_type': 'cash', 'strategy': 'Cash', 'instrument': 'VGSH', 'instrument_type': 'ETF', 'exchange': 'SMART', 'target_percentage': 0.3},
-            
-            # Investment portfolio - Equities strategy
-            {'account_type': 'investment', 'strategy': 'Equities', 'instrument': 'SPY', 'instrument_type': 'ETF', 'exchange': 'SMART', 'target_percentage': 0.4},
-            {'account_type': 'investment', 'strategy': 'Equities', 'instrument': 'QQQ', 'instrument_type': 'ETF', 'exchange': 'SMART', 'target_percentage': 0.3},
-            {'account_type': 'investment', 'strategy': 'Equities', 'instrument': 'EWS', 'instrument_type': 'ETF', 'exchange': 'SMART', 'target_percentage': 0.3},
-            
-            # Investment portfolio - Bonds strategy
-            {'account_type': 'investment', 'strategy': 'Bonds', 'instrument': 'AGG', 'instrument_type': 'ETF', 'exchange': 'SMART', 'target_percentage': 0.5},
-            {'account_type': 'investment', 'strategy': 'Bonds', 'instrument': 'LQD', 'instrument_type': 'ETF', 'exchange': 'SMART', 'target_percentage': 0.5},
-            
-            # Investment portfolio - Commodities strategy
-            {'account_type': 'investment', 'strategy': 'Commodities', 'instrument': 'GLD', 'instrument_type': 'ETF', 'exchange': 'SMART', 'target_percentage': 0.6},
-            {'account_type': 'investment', 'strategy': 'Commodities', 'instrument': 'USO', 'instrument_type': 'ETF', 'exchange': 'SMART', 'target_percentage': 0.4}
-        ]
-        
-        # Create DataFrame and save to CSV
-        df = pd.DataFrame(data)
-        os.makedirs(os.path.dirname(portfolio_file), exist_ok=True)
-        df.to_csv(portfolio_file, index=False)
-        
-        logger.info(f"Created sample portfolio allocation file at {portfolio_file}")
+
+# Short content hash baked into the served filename for cache busting
+_STYLE_CSS_NAME = f"style.{hashlib.md5(_STYLE_CSS).hexdigest()[:8]}.css"
+
+# Sample portfolio allocation, pre-serialized once. Values contain no commas
+# or quotes, so no csv-module escaping is needed.
+_PORTFOLIO_CSV = (
+    b"account_type,strategy,instrument,instrument_type,exchange,target_percentage\n"
+    # Cash portfolio
+    b"cash,Cash,CASH_SGD,CASH,,0.4\n"
+    b"cash,Cash,SHY,ETF,SMART,0.3\n"
+    b"cash,Cash,VGSH,ETF,SMART,0.3\n"
+    # Investment portfolio - Equities strategy
+    b"investment,Equities,SPY,ETF,SMART,0.4\n"
+    b"investment,Equities,QQQ,ETF,SMART,0.3\n"
+    b"investment,Equities,EWS,ETF,SMART,0.3\n"
+    # Investment portfolio - Bonds strategy
+    b"investment,Bonds,AGG,ETF,SMART,0.5\n"
+    b"investment,Bonds,LQD,ETF,SMART,0.5\n"
+    # Investment portfolio - Commodities strategy
+    b"investment,Commodities,GLD,ETF,SMART,0.6\n"
+    b"investment,Commodities,USO,ETF,SMART,0.4\n"
+)
+
+# Create static and sample config assets
+def init_assets():
+    """Create static and sample config files, sharing one scan per directory"""
+
+    # One scandir per directory answers every existence question below,
+    # instead of a stat per file
+    with os.scandir(app_state.static_dir) as it:
+        static_existing = {e.name for e in it}
+    with os.scandir(app_state.config_path) as it:
+        config_existing = {e.name for e in it}
+
+    if _STYLE_CSS_NAME not in static_existing:
+        (app_state.static_dir / _STYLE_CSS_NAME).write_bytes(_STYLE_CSS)
+        logger.info(f"Created CSS file static/{_STYLE_CSS_NAME}")
+
+    # Precompressed sibling so a gzip_static-style front server (or Flask)
+    # can serve Content-Encoding: gzip without compressing per request.
+    # mtime=0 keeps the bytes deterministic across restarts.
+    if _STYLE_CSS_NAME + '.gz' not in static_existing:
+        (app_state.static_dir / (_STYLE_CSS_NAME + '.gz')).write_bytes(
+            gzip.compress(_STYLE_CSS, compresslevel=9, mtime=0))
+        logger.info(f"Created precompressed CSS file static/{_STYLE_CSS_NAME}.gz")
+
+    # Sidecar schema so pandas readers can skip dtype inference; category
+    # dtypes collapse the repeated strategy/exchange strings to int codes
+    write_json_file(app_state.portfolio_csv.with_suffix('.schema.json'), {
+        'account_type': 'category',
+        'strategy': 'category',
+        'instrument': 'category',
+        'instrument_type': 'category',
+        'exchange': 'category',
+        'target_percentage': 'float32'
+    })
+
+    if app_state.portfolio_csv.name not in config_existing:
+        app_state.portfolio_csv.write_bytes(_PORTFOLIO_CSV)
+        logger.info(f"Created sample portfolio allocation file at {app_state.portfolio_csv}")
 
 # Initialize application
+_init_lock = Lock()
+
 def init_app():
-    """Initialize the application"""
-    
+    """Initialize the application (idempotent)"""
+
+    with _init_lock:
+        if app_state.initialized:
+            return
+
+        _run_init()
+        app_state.initialized = True
+
+def _run_init():
+    """One-time filesystem and config setup"""
+
     # Ensure directories exist
     ensure_directories()
-    
+
     # Create template files
     create_templates()
-    
-    # Create static files
-    create_static_files()
-    
-    # Create sample portfolio file
-    create_sample_portfolio_file()
-    
+
+    # Create static and sample config assets
+    init_assets()
+
     # Load configuration
     load_config()
 
+def prewarm():
+    """Build the managers and start the IBKR connect before serving.
+
+    Moves the multi-second cold start (config, IBKRApp, CSV order replay)
+    off the first request; the before_request hook stays as a safety net
+    for WSGI servers that import the app without running this block.
+    """
+    ensure_components()
+    if app_state.connect_future is None and not app_state.connected:
+        connect_ibkr_async()
+
 # Main entry point
 if __name__ == "__main__":
-    # Initialize application
-    init_app()
-    
-    # Start Flask app
-    app.run(debug=True, host='0.0.0.0', port=5001)
+    try:
+        from waitress import serve
+    except ImportError:
+        serve = None  # Fall back to the werkzeug dev server
+
+    if serve is not None:
+        # Production-style threaded server with HTTP/1.1 keep-alive, so the
+        # dashboard's polling requests reuse connections instead of paying a
+        # TCP handshake each time
+        init_app()
+        prewarm()
+        serve(app, host='0.0.0.0', port=5001, threads=8,
+              connection_limit=1000, channel_timeout=60)
+    else:
+        # Debug fallback. The reloader runs this file twice: only the serving
+        # child (WERKZEUG_RUN_MAIN=true) needs the filesystem setup.
+        if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+            init_app()
+            prewarm()
+        app.run(debug=True, host='0.0.0.0', port=5001, threaded=True)
                 
\ No newline at end of file
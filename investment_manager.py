@@ -1,4 +1,5 @@
 import os
+import json
 import logging
 import pandas as pd
 import time
@@ -24,6 +25,7 @@ class InvestmentManager:
         # Storage for account/portfolio data
         self.investment_account = None
         self.investment_portfolio = None
+        self._portfolio_file_mtime_ns = None  # mtime of the last parsed CSV
         
         # NEW: Order persistence and cash reservation
         self.pending_orders = []  # Track unfulfilled orders
@@ -48,6 +50,18 @@ class InvestmentManager:
         # Ensure directories exist
         os.makedirs(os.path.dirname(self.investment_config['order_log_path']), exist_ok=True)
     
+    def _load_csv_schema(self, file_path):
+        """Load the sidecar dtype schema for a CSV file, if one exists"""
+        schema_file = os.path.splitext(file_path)[0] + '.schema.json'
+        try:
+            with open(schema_file, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable schema file {schema_file}: {e}")
+            return None
+
     def load_portfolio_allocations(self, file_path=None):
         """Load investment portfolio allocation from CSV file"""
         if not file_path:
@@ -55,7 +69,13 @@ class InvestmentManager:
             
         try:
             if os.path.exists(file_path):
-                df = pd.read_csv(file_path)
+                # Skip the pandas parse entirely when the file is unchanged
+                mtime_ns = os.stat(file_path).st_mtime_ns
+                if (mtime_ns == self._portfolio_file_mtime_ns
+                        and self.investment_portfolio is not None):
+                    return True
+                dtype = self._load_csv_schema(file_path)
+                df = pd.read_csv(file_path, dtype=dtype, engine='c')
                 
                 # Filter for investment portfolio
                 investment_df = df[df['account_type'] == 'investment']
@@ -76,6 +96,7 @@ class InvestmentManager:
                     }
                 
                 self.investment_portfolio = investment_strategies
+                self._portfolio_file_mtime_ns = mtime_ns
                 logger.info(f"Loaded portfolio allocations: {len(investment_strategies)} investment strategies")
                 return True
             else:
@@ -1019,19 +1040,19 @@ class InvestmentManager:
             for key in ['AvailableFunds_SGD', 'AvailableFunds']:
                 if key in account_info:
                     current_value = float(account_info[key])
-                    account_info[key] = str(current_value + amount)
+                    account_info[key] = current_value + amount
             
             # Update cash values
             for key in ['TotalCashValue_SGD', 'TotalCashValue']:
                 if key in account_info:
                     current_value = float(account_info[key])
-                    account_info[key] = str(current_value + amount)
+                    account_info[key] = current_value + amount
             
             # Update total values
             for key in ['NetLiquidation_SGD', 'NetLiquidation']:
                 if key in account_info:
                     current_value = float(account_info[key])
-                    account_info[key] = str(current_value + amount)
+                    account_info[key] = current_value + amount
             
             logger.info(f"Updated investment account with {amount} cash")
             return True
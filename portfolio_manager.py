@@ -94,6 +94,7 @@ class PortfolioManager:
         # Portfolio allocation data
         self.cash_portfolio = None
         self.investment_portfolio = None
+        self._portfolio_file_mtime_ns = None  # mtime of the last parsed CSV
         
         # Load configuration
         self.config = self._load_config()
@@ -306,7 +307,7 @@ class PortfolioManager:
             'id': self.config['investment_account_id'],
             'description': 'Investment account managed separately by InvestmentManager'
         }
-        
+
         return {
             'cash_account': self.cash_account,
             'investment_account': self.investment_account
@@ -326,13 +327,13 @@ class PortfolioManager:
         current_cash = float(self.cash_account['data']['account_info']['TotalCashValue_SGD'])
         new_cash = current_cash + amount
         
-        self.cash_account['summary']['TotalCashValue_SGD'] = str(new_cash)
-        self.cash_account['summary']['AvailableFunds_SGD'] = str(new_cash)
-        self.cash_account['summary']['NetLiquidation_SGD'] = str(new_cash)
+        self.cash_account['summary']['TotalCashValue_SGD'] = new_cash
+        self.cash_account['summary']['AvailableFunds_SGD'] = new_cash
+        self.cash_account['summary']['NetLiquidation_SGD'] = new_cash
         
-        self.cash_account['data']['account_info']['TotalCashValue_SGD'] = str(new_cash)
-        self.cash_account['data']['account_info']['AvailableFunds_SGD'] = str(new_cash)
-        self.cash_account['data']['account_info']['NetLiquidation_SGD'] = str(new_cash)
+        self.cash_account['data']['account_info']['TotalCashValue_SGD'] = new_cash
+        self.cash_account['data']['account_info']['AvailableFunds_SGD'] = new_cash
+        self.cash_account['data']['account_info']['NetLiquidation_SGD'] = new_cash
         
         # Record transaction
         transaction = {
@@ -352,11 +353,29 @@ class PortfolioManager:
         
         return success
     
+    def _load_csv_schema(self, file_path):
+        """Load the sidecar dtype schema for a CSV file, if one exists"""
+        schema_file = os.path.splitext(file_path)[0] + '.schema.json'
+        try:
+            with open(schema_file, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable schema file {schema_file}: {e}")
+            return None
+
     def load_portfolio_allocations(self):
         """Load portfolio allocation from CSV file"""
         try:
             if os.path.exists(self.config['portfolio_file']):
-                df = pd.read_csv(self.config['portfolio_file'])
+                # Skip the pandas parse entirely when the file is unchanged
+                mtime_ns = os.stat(self.config['portfolio_file']).st_mtime_ns
+                if (mtime_ns == self._portfolio_file_mtime_ns
+                        and self.cash_portfolio is not None):
+                    return True
+                dtype = self._load_csv_schema(self.config['portfolio_file'])
+                df = pd.read_csv(self.config['portfolio_file'], dtype=dtype, engine='c')
                 
                 # Filter for cash portfolio
                 cash_df = df[df['account_type'] == 'cash']
@@ -380,6 +399,7 @@ class PortfolioManager:
                     }
                 
                 self.investment_portfolio = investment_strategies
+                self._portfolio_file_mtime_ns = mtime_ns
                 
                 logger.info(f"Loaded portfolio allocations: {len(self.cash_portfolio)} cash instruments, "
                            f"{len(self.investment_portfolio)} investment strategies")
@@ -470,13 +490,13 @@ class PortfolioManager:
         # Update cash account
         new_cash = current_cash - amount
         
-        self.cash_account['summary']['TotalCashValue_SGD'] = str(new_cash)
-        self.cash_account['summary']['AvailableFunds_SGD'] = str(new_cash)
-        self.cash_account['summary']['NetLiquidation_SGD'] = str(new_cash)
+        self.cash_account['summary']['TotalCashValue_SGD'] = new_cash
+        self.cash_account['summary']['AvailableFunds_SGD'] = new_cash
+        self.cash_account['summary']['NetLiquidation_SGD'] = new_cash
         
-        self.cash_account['data']['account_info']['TotalCashValue_SGD'] = str(new_cash)
-        self.cash_account['data']['account_info']['AvailableFunds_SGD'] = str(new_cash)
-        self.cash_account['data']['account_info']['NetLiquidation_SGD'] = str(new_cash)
+        self.cash_account['data']['account_info']['TotalCashValue_SGD'] = new_cash
+        self.cash_account['data']['account_info']['AvailableFunds_SGD'] = new_cash
+        self.cash_account['data']['account_info']['NetLiquidation_SGD'] = new_cash
         
         # Record transaction
         transaction = {
@@ -1,9 +1,13 @@
 import os
 import json
-import csv
 import logging
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
+
 logger = logging.getLogger(__name__)
 
 # Hardcoded file path for account data
@@ -21,9 +25,14 @@ def save_account_details(account_data, account_id):
         # Create directory path if it doesn't exist
         os.makedirs(os.path.dirname(ACCOUNT_DATA_PATH), exist_ok=True)
         
-        # Save to hardcoded JSON file path
-        with open(ACCOUNT_DATA_PATH, 'w') as f:
-            json.dump(account_data, f, indent=2)
+        # Save to hardcoded JSON file path. orjson's indent handling is
+        # implemented in Rust, unlike stdlib json's pure-Python one.
+        if orjson is not None:
+            payload = orjson.dumps(account_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(account_data, indent=2).encode()
+        with open(ACCOUNT_DATA_PATH, 'wb') as f:
+            f.write(payload)
         
         logger.info(f"Account data saved to {ACCOUNT_DATA_PATH}")
         return True
@@ -44,8 +53,9 @@ def load_account_details(account_id):
     try:
         # Try loading from hardcoded path
         if os.path.exists(ACCOUNT_DATA_PATH):
-            with open(ACCOUNT_DATA_PATH, 'r') as f:
-                account_data = json.load(f)
+            with open(ACCOUNT_DATA_PATH, 'rb') as f:
+                raw = f.read()
+            account_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
             logger.info(f"Account data loaded from {ACCOUNT_DATA_PATH}")
             return account_data
@@ -53,8 +63,9 @@ def load_account_details(account_id):
         # If the hardcoded path doesn't exist, use DU4184147.json in the current directory as fallback
         fallback_path = "DU4184147.json"
         if os.path.exists(fallback_path):
-            with open(fallback_path, 'r') as f:
-                account_data = json.load(f)
+            with open(fallback_path, 'rb') as f:
+                raw = f.read()
+            account_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
             logger.info(f"Account data loaded from fallback path {fallback_path}")
             
@@ -86,24 +97,30 @@ def load_orders_from_csv(csv_path='logs/orders.csv'):
             logger.warning(f"Orders CSV file not found: {csv_path}")
             return orders
         
-        with open(csv_path, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Convert CSV row to order format
-                order = {
-                    'contract': {
-                        'symbol': row.get('symbol'),
-                        'secType': row.get('secType'),
-                        'exchange': row.get('exchange'),
-                        'currency': 'USD'  # Default currency
-                    },
-                    'action': row.get('action'),
-                    'quantity': float(row.get('quantity', 0)),
-                    'price': float(row.get('price', 0)),
-                    'strategy': row.get('strategy'),
-                    'order_type': 'MKT'
-                }
-                orders.append(order)
+        # C-engine parse with explicit dtypes: no per-row Python dict building
+        # in the reader and no dtype inference over the numeric columns
+        import pandas as pd
+        wanted = {'symbol', 'secType', 'exchange', 'action', 'quantity',
+                  'price', 'strategy'}
+        df = pd.read_csv(csv_path, usecols=lambda c: c in wanted,
+                         dtype={'quantity': 'float64', 'price': 'float64'},
+                         engine='c')
+        for row in df.to_dict('records'):
+            # Convert CSV row to order format
+            order = {
+                'contract': {
+                    'symbol': row.get('symbol'),
+                    'secType': row.get('secType'),
+                    'exchange': row.get('exchange'),
+                    'currency': 'USD'  # Default currency
+                },
+                'action': row.get('action'),
+                'quantity': float(row.get('quantity', 0)),
+                'price': float(row.get('price', 0)),
+                'strategy': row.get('strategy'),
+                'order_type': 'MKT'
+            }
+            orders.append(order)
         
         logger.info(f"Loaded {len(orders)} orders from {csv_path}")
         return orders
@@ -183,14 +200,14 @@ def update_account_with_orders(account_data, orders):
                     for key in cash_keys:
                         if key in updated_account['data']['account_info']:
                             current_cash = float(updated_account['data']['account_info'][key])
-                            updated_account['data']['account_info'][key] = str(current_cash - order_value)
+                            updated_account['data']['account_info'][key] = current_cash - order_value
                 
                 # Update in summary
                 if 'summary' in updated_account:
                     for key in cash_keys:
                         if key in updated_account['summary']:
                             current_cash = float(updated_account['summary'][key])
-                            updated_account['summary'][key] = str(current_cash - order_value)
+                            updated_account['summary'][key] = current_cash - order_value
                 
             elif action == 'SELL':
                 # Calculate realized P&L
@@ -215,14 +232,14 @@ def update_account_with_orders(account_data, orders):
                         for key in cash_keys:
                             if key in updated_account['data']['account_info']:
                                 current_cash = float(updated_account['data']['account_info'][key])
-                                updated_account['data']['account_info'][key] = str(current_cash + order_value)
+                                updated_account['data']['account_info'][key] = current_cash + order_value
                     
                     # Update in summary
                     if 'summary' in updated_account:
                         for key in cash_keys:
                             if key in updated_account['summary']:
                                 current_cash = float(updated_account['summary'][key])
-                                updated_account['summary'][key] = str(current_cash + order_value)
+                                updated_account['summary'][key] = current_cash + order_value
         
         # Update total values based on positions
         position_value = 0
@@ -242,12 +259,12 @@ def update_account_with_orders(account_data, orders):
             
             for key in ['NetLiquidation_SGD', 'EquityWithLoanValue_SGD']:
                 if key in updated_account['data']['account_info']:
-                    updated_account['data']['account_info'][key] = str(total_value)
+                    updated_account['data']['account_info'][key] = total_value
         
         if 'summary' in updated_account:
             for key in ['NetLiquidation_SGD', 'EquityWithLoanValue_SGD']:
                 if key in updated_account['summary']:
-                    updated_account['summary'][key] = str(cash_value + position_value)
+                    updated_account['summary'][key] = cash_value + position_value
         
         return updated_account
     